@@ -1,4 +1,6 @@
 
+import json
+import subprocess
 import sys
 from pathlib import Path
 from clang.cindex import Index, Config, CursorKind, TranslationUnit
@@ -6,37 +8,92 @@ from clang.cindex import Index, Config, CursorKind, TranslationUnit
 # Configure clang path if needed (AutoDocGen usually handles this, assume it's in path or handled)
 # If this fails, I might need to replicate config.
 
-def walk(cursor, depth=0):
-    indent = "  " * depth
+def walk(root):
+    # Iterative pre-order traversal: large TUs can have millions of nodes,
+    # so avoid a Python call frame per node and hoist attribute lookups.
+    stack = [(root, 0)]
+    pop = stack.pop
+    while stack:
+        cursor, depth = pop()
+        indent = "  " * depth
+        kind = cursor.kind
+        spelling = cursor.spelling
+        try:
+            loc = cursor.location
+            loc_file = loc.file
+            filename = loc_file.name if loc_file else "None"
+            print(f"{indent}{kind} : {spelling} [{filename}:{loc.line}]")
+        except AttributeError:
+            print(f"{indent}{kind} : {spelling} [Error getting loc]")
+
+        # Push children in reverse so they pop in source order
+        children = list(cursor.get_children())
+        child_depth = depth + 1
+        for child in reversed(children):
+            stack.append((child, child_depth))
+
+def dump_ast_json(fpath, args):
+    # One clang subprocess replaces an FFI call per AST node, which is
+    # much faster for large TUs than walking cursors from Python.
+    cmd = ["clang", "-Xclang", "-ast-dump=json", "-fsyntax-only", *args, str(fpath)]
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        print("clang not found on PATH; rerun with --python to use the bindings")
+        return
     try:
-        loc = cursor.location
-        filename = loc.file.name if loc.file else "None"
-        line = loc.line
-        print(f"{indent}{cursor.kind} : {cursor.spelling} [{filename}:{line}]")
-    except:
-        print(f"{indent}{cursor.kind} : {cursor.spelling} [Error getting loc]")
-    
-    for child in cursor.get_children():
-        walk(child, depth + 1)
+        root = json.load(proc.stdout)
+    except json.JSONDecodeError as e:
+        stderr = proc.stderr.read().decode(errors="replace")
+        print(f"Failed to read AST JSON from clang: {e}")
+        if stderr:
+            print(stderr)
+        return
+    finally:
+        proc.stdout.close()
+        proc.stderr.close()
+        proc.wait()
+
+    stack = [(root, 0)]
+    pop = stack.pop
+    while stack:
+        node, depth = pop()
+        indent = "  " * depth
+        kind = node.get("kind", "?")
+        name = node.get("name", "")
+        loc = node.get("loc", {})
+        print(f"{indent}{kind} : {name} [{loc.get('file', '')}:{loc.get('line', '')}]")
+
+        child_depth = depth + 1
+        for child in reversed(node.get("inner", [])):
+            stack.append((child, child_depth))
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python debug_clang.py <file>")
+        print("Usage: python debug_clang.py <file> [--python]")
         return
 
+    # --python keeps the old cindex walk around for comparison
+    use_bindings = "--python" in sys.argv[2:]
+
     fpath = Path(sys.argv[1]).resolve()
     print(f"Parsing: {fpath}")
 
-    index = Index.create()
-    args = ["-x", "c++", f"-I{fpath.parent}", f"-I{fpath.parent.parent}/include"] 
+    args = ["-x", "c++", f"-I{fpath.parent}", f"-I{fpath.parent.parent}/include"]
     # Add include paths roughly
 
+    if not use_bindings:
+        print("\nAST:")
+        dump_ast_json(fpath, args)
+        return
+
+    index = Index.create()
     tu = index.parse(str(fpath), args=args)
-    
+
     print("Diagnostics:")
     for diag in tu.diagnostics:
         print(diag)
-        
+
     print("\nAST:")
     walk(tu.cursor)
 
@@ -32,10 +32,12 @@ def debug_llm_generation():
         chunks = analyzer.chunker.chunk_file(file_path, analysis, analyzer.parser._source_code)
         for i, chunk in enumerate(chunks):
             print(f"Chunk {i}: Processed={chunk.is_processed}")
-            if hasattr(chunk, 'llm_response'):
+            # llm_response is a declared CodeChunk field (default ""), so a
+            # plain truthiness test beats a hasattr probe
+            if chunk.llm_response:
                 print(f"Response prefix: {chunk.llm_response[:50]}...")
             else:
-                print("No response attribute.")
+                print("No response recorded.")
 
     except Exception as e:
         print(f"EXCEPTION CAUGHT: {e}")
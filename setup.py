@@ -0,0 +1,27 @@
+"""
+Optional Cython build for the hot pure-Python modules.
+
+The package is fully functional without Cython. When Cython is available
+at build time, the orchestration and traversal-heavy modules are compiled
+for a modest interpreter-dispatch speedup; the .py sources are always
+shipped so environments without the compiled extensions fall back
+transparently.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            "src/autodocgen/analyzer.py",
+            "src/autodocgen/parser/cpp_parser.py",
+            "src/autodocgen/chunker/intelligent_chunker.py",
+        ],
+        language_level=3,
+    )
+except ImportError:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
@@ -2,6 +2,10 @@
 Main analyzer that orchestrates the documentation generation pipeline.
 """
 
+import hashlib
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 import re
@@ -20,6 +24,79 @@ from autodocgen.graph import DependencyStore, DependencyExtractor, GraphVisualiz
 
 console = Console()
 
+# Matches markdown heading lines; used to verify generated docs in one pass
+_HEADING_RE = re.compile(r"^#+\s.*$", re.MULTILINE)
+
+
+# Per-process parser reused across files in parse_all worker processes.
+# libclang's Index is not safely shareable across threads but is fine
+# when each worker process owns its own instance.
+_worker_parser: Optional[CppParser] = None
+
+
+def _parse_worker(config: Config, file_path: Path) -> CppFileAnalysis:
+    """Parse one file in a worker process, reusing a per-process parser."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = CppParser(config)
+    return _worker_parser.parse_file(file_path)
+
+
+class _SourcePrefetcher:
+    """
+    Warms the OS page cache for upcoming source files.
+
+    A background thread reads a bounded window ahead of the parser so file
+    contents are already cached by the time libclang opens them. The win
+    on cold caches comes from overlapping read latency with CPU-bound
+    parsing of the current file.
+    """
+
+    def __init__(self, files: list[Path], window: int = 8):
+        self._files = files
+        self._window = threading.Semaphore(window)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        for file_path in self._files:
+            self._window.acquire()
+            try:
+                file_path.read_bytes()
+            except OSError:
+                pass
+
+    def advance(self) -> None:
+        """Let the prefetcher read one more file ahead."""
+        self._window.release()
+
+
+def _walk_files(root: str, prune=None):
+    """
+    Yield os.DirEntry objects for all files under root.
+
+    Iterative os.scandir traversal keeps dirent type information cached,
+    avoiding the extra stat per entry that Path.rglob + is_file() incurs.
+    When prune is given, it is called with each directory's relative path
+    (trailing slash included) and a true result skips the whole subtree,
+    so excluded trees like third_party/ are never traversed.
+    """
+    prefix_len = len(root.rstrip(os.sep)) + 1
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if prune and prune(entry.path[prefix_len:] + "/"):
+                            continue
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
+
 
 class CodebaseAnalyzer:
     """
@@ -60,6 +137,29 @@ class CodebaseAnalyzer:
         self._files: list[Path] = []
         self._analyses: dict[Path, CppFileAnalysis] = {}
 
+        # Scan filters compiled once: extension set plus the config's
+        # shared exclude matcher (one alternation regex over all exclude
+        # globs), so the per-file hot loop is a set lookup and a single
+        # regex match.
+        self._extensions = frozenset(config.parser.supported_extensions)
+        self._is_excluded = config.parser.is_excluded
+
+        # Patterns ending in '*' match every descendant of a matching
+        # directory, so those subtrees can be pruned before descending.
+        self._prune_re = None
+        prune_patterns = [p for p in config.parser.exclude_patterns if p.endswith("*")]
+        if prune_patterns:
+            self._prune_re = re.compile(
+                "|".join(f"(?:{fnmatch.translate(p)})" for p in prune_patterns)
+            )
+
+        # Dependency symbols recur across thousands of chunks; cache their
+        # rendered context once registration is stable (after parse_all).
+        self._dep_ctx_cache: dict[str, str] = {}
+        # Methods of a class usually share one dependency set, so the
+        # assembled joined block is memoized per set as well.
+        self._dep_ctx_joined: dict[tuple[str, ...], str] = {}
+
     def scan_codebase(self) -> int:
         """
         Scan the codebase for C++ files.
@@ -68,26 +168,25 @@ class CodebaseAnalyzer:
             Number of C++ files found
         """
         self._files = []
-        extensions = set(self.config.parser.supported_extensions)
-        exclude_patterns = self.config.parser.exclude_patterns
+        extensions = self._extensions
+        is_excluded = self._is_excluded
 
-        for file_path in self.config.codebase_path.rglob("*"):
-            if not file_path.is_file():
-                continue
+        codebase_path = str(self.config.codebase_path)
+        prefix_len = len(codebase_path.rstrip(os.sep)) + 1
 
-            if file_path.suffix not in extensions:
+        prune = self._prune_re.match if self._prune_re else None
+        for entry in _walk_files(codebase_path, prune=prune):
+            name = entry.name
+            dot = name.rfind(".")
+            if dot <= 0 or name[dot:] not in extensions:
                 continue
 
-            # Check exclude patterns
-            relative = file_path.relative_to(self.config.codebase_path)
-            excluded = False
-            for pattern in exclude_patterns:
-                if fnmatch.fnmatch(str(relative), pattern):
-                    excluded = True
-                    break
+            relative = entry.path[prefix_len:]
+            if is_excluded(relative):
+                continue
 
-            if not excluded:
-                self._files.append(file_path)
+            # Only survivors are materialized as Path objects
+            self._files.append(Path(entry.path))
 
         return len(self._files)
 
@@ -102,33 +201,75 @@ class CodebaseAnalyzer:
             task_id: Optional TaskID for progress updates
         """
         total = len(self._files)
-        
+
+        # New registrations invalidate any previously rendered contexts
+        self._dep_ctx_cache.clear()
+        self._dep_ctx_joined.clear()
+
         if progress and task_id is not None:
             progress.update(task_id, total=total)
 
-        for i, file_path in enumerate(self._files):
-            if progress:
-                # Update description and advance
-                desc = f"Parsing {file_path.name}"
-                if task_id is not None:
-                    progress.update(task_id, description=desc, advance=1)
+        def record(file_path: Path, analysis: CppFileAnalysis) -> None:
+            self._analyses[file_path] = analysis
+
+            # Register for cross-referencing
+            self.context_builder.register_analysis(analysis)
+
+            # Extract dependencies (streaming to SQLite)
+            if not self.skip_graph:
+                self.dependency_extractor.extract_file(file_path, analysis)
+
+        # Refresh the description only every Nth file; re-rendering the live
+        # display per file is measurable on large codebases.
+        update_every = max(1, total // 200)
+        done = 0
+
+        def advance(file_path: Path) -> None:
+            nonlocal done
+            done += 1
+            if not progress:
+                return
+            refresh = done % update_every == 0 or done == total
+            if task_id is not None:
+                if refresh:
+                    progress.update(task_id, description=f"Parsing {file_path.name}", advance=1)
                 else:
-                    # Fallback
-                    progress.update(progress.task_ids[0], description=desc)
-
-            try:
-                analysis = self.parser.parse_file(file_path)
-                self._analyses[file_path] = analysis
-
-                # Register for cross-referencing
-                self.context_builder.register_analysis(analysis)
-
-                # Extract dependencies (streaming to SQLite)
-                if not self.skip_graph:
-                    self.dependency_extractor.extract_file(file_path, analysis)
-
-            except Exception as e:
-                console.print(f"[red]Error parsing {file_path}: {e}[/]")
+                    progress.update(task_id, advance=1)
+            elif refresh:
+                progress.update(progress.task_ids[0], description=f"Parsing {file_path.name}")
+
+        max_workers = min(
+            total, max(1, self.config.parallel_workers), os.cpu_count() or 1
+        )
+        if max_workers <= 1:
+            # Serial parsing overlaps I/O by prefetching upcoming sources
+            prefetcher = _SourcePrefetcher(self._files)
+            for file_path in self._files:
+                advance(file_path)
+                try:
+                    record(file_path, self.parser.parse_file(file_path))
+                except Exception as e:
+                    console.print(f"[red]Error parsing {file_path}: {e}[/]")
+                finally:
+                    prefetcher.advance()
+            return
+
+        # libclang TU construction is CPU-bound and independent per file,
+        # so fan parsing out across processes. Registration and dependency
+        # extraction stay on the main process to avoid shared-state races.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_parse_worker, self.config, file_path): file_path
+                for file_path in self._files
+            }
+
+            for future in as_completed(futures):
+                file_path = futures[future]
+                advance(file_path)
+                try:
+                    record(file_path, future.result())
+                except Exception as e:
+                    console.print(f"[red]Error parsing {file_path}: {e}[/]")
 
     def generate_documentation(
         self, progress: Optional[Progress] = None, task_id: Optional[TaskID] = None
@@ -148,32 +289,46 @@ class CodebaseAnalyzer:
             )
 
         total = len(self._analyses)
-        
+
         if progress and task_id is not None:
             progress.update(task_id, total=total)
 
-        for i, (file_path, analysis) in enumerate(self._analyses.items()):
-            if progress:
-                desc = f"Documenting {file_path.name}"
-                if task_id is not None:
-                    progress.update(task_id, description=desc, advance=1)
-                else:
-                    progress.update(
-                        progress.task_ids[0],
-                        description=f"Documenting [{i+1}/{total}] {file_path.name}",
-                    )
-
-            try:
-                if llm_available:
-                    self._document_file(file_path, analysis)
-                else:
-                    # Fallback: Structural docs only
-                    doc = self.doc_generator.generate_file_documentation(analysis)
-                    analysis.file_documentation = doc
-                    self.doc_generator.write_file_documentation(file_path, analysis, doc)
-                    
-            except Exception as e:
-                console.print(f"[red]Error documenting {file_path}: {e}[/]")
+        def document_one(file_path: Path, analysis: CppFileAnalysis) -> None:
+            if llm_available:
+                self._document_file(file_path, analysis)
+            else:
+                # Fallback: Structural docs only
+                doc = self.doc_generator.generate_file_documentation(analysis)
+                analysis.file_documentation = doc
+                self.doc_generator.write_file_documentation(file_path, analysis, doc)
+
+        # Files are I/O-bound on the LLM round-trip, so document several
+        # concurrently and let Ollama batch the in-flight requests.
+        max_workers = max(1, self.config.llm.concurrency)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(document_one, file_path, analysis): file_path
+                for file_path, analysis in self._analyses.items()
+            }
+
+            update_every = max(1, total // 200)
+            for done, future in enumerate(as_completed(futures), start=1):
+                file_path = futures[future]
+                if progress:
+                    refresh = done % update_every == 0 or done == total
+                    desc = f"Documenting {file_path.name}"
+                    if task_id is not None:
+                        if refresh:
+                            progress.update(task_id, description=desc, advance=1)
+                        else:
+                            progress.update(task_id, advance=1)
+                    elif refresh:
+                        progress.update(progress.task_ids[0], description=desc)
+
+                try:
+                    future.result()
+                except Exception as e:
+                    console.print(f"[red]Error documenting {file_path}: {e}[/]")
 
     def _document_file(self, file_path: Path, analysis: CppFileAnalysis) -> None:
         """
@@ -183,47 +338,86 @@ class CodebaseAnalyzer:
             file_path: Path to the source file
             analysis: Parsed analysis of the file
         """
-        # Read source code
-        source_code = file_path.read_text(encoding="utf-8", errors="replace")
-
-        # Chunk the file
-        chunks = self.chunker.chunk_file(file_path, analysis, source_code)
-
-        # Enrich chunk contexts
-        for chunk in chunks:
-            self.context_builder.enrich_chunk_context(chunk, analysis)
-
-        # Process each chunk with LLM
+        # Read source code (single decode pass over the raw bytes)
+        source_bytes = file_path.read_bytes()
+
+        # Unchanged source with clean existing docs: skip the LLM entirely
+        source_hash = hashlib.blake2b(source_bytes).hexdigest()
+        existing = self.doc_generator.read_documentation(file_path)
+        if (
+            existing
+            and f"source_blake2b: {source_hash}" in existing
+            and "validation_failed" not in existing
+            and "*Documentation generation failed*" not in existing
+        ):
+            analysis.file_documentation = existing
+            console.print(f"[dim]Unchanged source, kept existing docs for {file_path.name}[/]")
+            return
+
+        source_code = source_bytes.decode("utf-8", "replace")
+
+        # Chunk the file, enriching each chunk's context as it is built
+        chunks = self.chunker.chunk_file(
+            file_path,
+            analysis,
+            source_code,
+            on_chunk=lambda c: self.context_builder.enrich_chunk_context(c, analysis),
+        )
+
+        # Process chunks with the LLM in one batched round. Each worker
+        # builds its own prompt just before submitting, so prompt
+        # construction for one chunk overlaps generation for the others.
         chunk_docs: list[str] = []
         system_prompt = self.prompt_builder.get_system_prompt()
 
-        for chunk in chunks:
-            # Build prompt
+        def process_chunk(chunk):
             dep_context = self._get_dependency_context(chunk)
             prompt = self.prompt_builder.build_chunk_prompt(chunk, dep_context)
+            return self.llm_client.generate(prompt, system_prompt)
 
-            # Generate documentation
-            response = self.llm_client.generate(prompt, system_prompt)
+        # Fast path: small files are a single chunk and need none of the
+        # multi-chunk bookkeeping or synthesis handling
+        if len(chunks) == 1:
+            chunk = chunks[0]
+            response = process_chunk(chunk)
+
+            if response.error:
+                console.print(f"[yellow]LLM error for {chunk.primary_symbol}: {response.error}[/]")
+                documentation = f"# {chunk.primary_symbol}\n\n*Documentation generation failed*"
+            else:
+                documentation = response.content
+                chunk.llm_response = response.content
+                chunk.is_processed = True
 
+            analysis.file_documentation = documentation
+            self._verify_documentation(analysis, documentation)
+            self.doc_generator.write_file_documentation(
+                file_path, analysis, analysis.file_documentation,
+                source_hash=source_hash,
+            )
+            return
+
+        max_workers = min(len(chunks), max(1, self.config.batch_size))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = list(executor.map(process_chunk, chunks))
+
+        for chunk, response in zip(chunks, responses):
             if response.error:
                 console.print(f"[yellow]LLM error for {chunk.primary_symbol}: {response.error}[/]")
                 chunk_docs.append(f"# {chunk.primary_symbol}\n\n*Documentation generation failed*")
             else:
                 chunk_docs.append(response.content)
-                # Show output snippet
-                preview = response.content[:100].replace("\n", " ") + "..."
-                console.print(f"[dim]Generated for {chunk.primary_symbol}: {preview}[/]")
+                if self.config.verbose:
+                    # Show output snippet
+                    preview = response.content[:100].replace("\n", " ") + "..."
+                    console.print(f"[dim]Generated for {chunk.primary_symbol}: {preview}[/]")
                 chunk.llm_response = response.content
                 chunk.is_processed = True
 
-        # Synthesize if multiple chunks
-        if len(chunks) > 1:
-            # Skip LLM synthesis to avoid token truncation on large files.
-            # Concatenate chunks to preserve all details.
-            console.print("[dim]Skipping synthesis to preserve detail (multi-chunk file)[/]")
-            documentation = "\n\n".join(chunk_docs)
-        else:
-            documentation = chunk_docs[0] if chunk_docs else ""
+        # Skip LLM synthesis to avoid token truncation on large files.
+        # Concatenate chunks to preserve all details.
+        console.print("[dim]Skipping synthesis to preserve detail (multi-chunk file)[/]")
+        documentation = "\n\n".join(chunk_docs)
 
         # Store documentation in analysis
         analysis.file_documentation = documentation
@@ -232,32 +426,36 @@ class CodebaseAnalyzer:
         self._verify_documentation(analysis, documentation)
 
         # Generate output files
-        self.doc_generator.write_file_documentation(file_path, analysis, analysis.file_documentation)
+        self.doc_generator.write_file_documentation(
+            file_path, analysis, analysis.file_documentation,
+            source_hash=source_hash,
+        )
 
     def _verify_documentation(self, analysis: CppFileAnalysis, documentation: str) -> list[str]:
         """
         Verify that all functions in the analysis are present in the documentation.
         Returns a list of missing function names.
         """
-        import re
         missing_functions = []
-        
+
+        # Extract all heading lines in one pass; per-name checks then scan
+        # just the headings instead of re-searching the whole document with
+        # a freshly compiled regex per function.
+        heading_blob = "\n".join(_HEADING_RE.findall(documentation)).lower()
+
         # Check global functions
         for func in analysis.functions:
-            pattern = fr"^#+\s+.*{re.escape(func.name)}"
-            match = re.search(pattern, documentation, re.MULTILINE | re.IGNORECASE)
-            if not match:
+            if func.name.lower() not in heading_blob:
                 missing_functions.append(func.name)
 
         # Check class methods
         for cls in analysis.classes:
             for method in cls.methods:
-                pattern = fr"^#+\s+.*{re.escape(method.name)}"
-                match = re.search(pattern, documentation, re.MULTILINE | re.IGNORECASE)
-                if not match:
+                if method.name.lower() not in heading_blob:
                     # Provide qualified name if possible to avoid ambiguity, or just name
                     missing_functions.append(method.name)
-        
+
+
         if missing_functions:
             marker = f"\n\n<!-- validation_failed: missing [{', '.join(missing_functions)}] -->"
             console.print(f"[red]Validation failed: Missing documentation for {len(missing_functions)} functions[/]")
@@ -288,7 +486,10 @@ class CodebaseAnalyzer:
                  cleaned_doc = existing_doc.replace("*Documentation generation failed*", "")
                  cleaned_doc = re.sub(r"\n\n<!-- validation_failed:.*?-->", "", cleaned_doc, flags=re.DOTALL)
                  if cleaned_doc != existing_doc:
-                     self.doc_generator.write_file_documentation(file_path, analysis, cleaned_doc)
+                     self.doc_generator.write_file_documentation(
+                         file_path, analysis, cleaned_doc,
+                         source_hash=self.doc_generator.source_hash(file_path),
+                     )
                      console.print(f"[green]Documentation for {file_path.name} is complete. Removed failure markers.[/]")
                      return True
 
@@ -299,16 +500,17 @@ class CodebaseAnalyzer:
         
         new_docs = []
         system_prompt = self.prompt_builder.get_system_prompt()
-        
+
+        # Index once: global functions take precedence over class methods,
+        # matching the old first-match linear search without the
+        # O(missing x functions) rescans
+        by_name = {f.name: f for f in reversed(analysis.functions)}
+        for cls in analysis.classes:
+            for method in cls.methods:
+                by_name.setdefault(method.name, method)
+
         for func_name in missing_names:
-            # Find the function object (check global functions first, then class methods)
-            func_info = next((f for f in analysis.functions if f.name == func_name), None)
-            if not func_info:
-                for cls in analysis.classes:
-                    func_info = next((m for m in cls.methods if m.name == func_name), None)
-                    if func_info:
-                        break
-            
+            func_info = by_name.get(func_name)
             if not func_info:
                 continue
 
@@ -354,7 +556,10 @@ Return ONLY the markdown documentation for this function, starting with a level
             
             # Update analysis and write to disk
             analysis.file_documentation = final_doc
-            self.doc_generator.write_file_documentation(file_path, analysis, final_doc)
+            self.doc_generator.write_file_documentation(
+                file_path, analysis, final_doc,
+                source_hash=self.doc_generator.source_hash(file_path),
+            )
             
             console.print(f"[bold green]Successfully repaired {file_path.name}![/]")
             return True
@@ -375,15 +580,18 @@ Return ONLY the markdown documentation for this function, starting with a level
             analysis: Parsed analysis of the file
             additional_context: Dictionary of context from other files
         """
-        # Read source code
-        source_code = file_path.read_text(encoding="utf-8", errors="replace")
-
-        # Chunk the file
-        chunks = self.chunker.chunk_file(file_path, analysis, source_code)
-
-        # Enrich chunk contexts
-        for chunk in chunks:
-            self.context_builder.enrich_chunk_context(chunk, analysis)
+        # Read source code (single decode pass over the raw bytes)
+        source_bytes = file_path.read_bytes()
+        source_hash = hashlib.blake2b(source_bytes).hexdigest()
+        source_code = source_bytes.decode("utf-8", "replace")
+
+        # Chunk the file, enriching each chunk's context as it is built
+        chunks = self.chunker.chunk_file(
+            file_path,
+            analysis,
+            source_code,
+            on_chunk=lambda c: self.context_builder.enrich_chunk_context(c, analysis),
+        )
 
         # Process each chunk with LLM
         chunk_docs: list[str] = []
@@ -399,26 +607,32 @@ Return ONLY the markdown documentation for this function, starting with a level
             if contexts:
                 extra_ctx_str = "\n\n### Related Documentation Context\nThe following summaries from related files may act as context:\n\n" + "\n\n".join(contexts)
 
-        for chunk in chunks:
-            # Build prompt
+        def process_chunk(chunk):
             dep_context = self._get_dependency_context(chunk)
-            
+
             # Inject extra context
             full_context = dep_context + extra_ctx_str
-            
+
             prompt = self.prompt_builder.build_chunk_prompt(chunk, full_context)
+            return self.llm_client.generate(prompt, system_prompt)
 
-            # Generate documentation
-            response = self.llm_client.generate(prompt, system_prompt)
+        if len(chunks) == 1:
+            responses = [process_chunk(chunks[0])]
+        else:
+            max_workers = min(len(chunks), max(1, self.config.batch_size))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(executor.map(process_chunk, chunks))
 
+        for chunk, response in zip(chunks, responses):
             if response.error:
                 console.print(f"[yellow]LLM error for {chunk.primary_symbol}: {response.error}[/]")
                 chunk_docs.append(f"# {chunk.primary_symbol}\n\n*Documentation generation failed*")
             else:
                 chunk_docs.append(response.content)
-                # Show output snippet
-                preview = response.content[:100].replace("\n", " ") + "..."
-                console.print(f"[dim]Generated for {chunk.primary_symbol}: {preview}[/]")
+                if self.config.verbose:
+                    # Show output snippet
+                    preview = response.content[:100].replace("\n", " ") + "..."
+                    console.print(f"[dim]Generated for {chunk.primary_symbol}: {preview}[/]")
                 chunk.llm_response = response.content
                 chunk.is_processed = True
 
@@ -438,18 +652,32 @@ Return ONLY the markdown documentation for this function, starting with a level
         self._verify_documentation(analysis, documentation)
 
         # Generate output files
-        self.doc_generator.write_file_documentation(file_path, analysis, analysis.file_documentation)
+        self.doc_generator.write_file_documentation(
+            file_path, analysis, analysis.file_documentation,
+            source_hash=source_hash,
+        )
 
     def _get_dependency_context(self, chunk) -> str:
         """Get cross-reference context for a chunk's dependencies."""
+        deps = tuple(chunk.context.dependencies[:5])  # Limit to avoid huge prompts
+        joined = self._dep_ctx_joined.get(deps)
+        if joined is not None:
+            return joined
+
         contexts: list[str] = []
+        cache = self._dep_ctx_cache
 
-        for dep in chunk.context.dependencies[:5]:  # Limit to avoid huge prompts
-            dep_doc = self.context_builder.get_dependency_context(dep)
+        for dep in deps:
+            dep_doc = cache.get(dep)
+            if dep_doc is None:
+                dep_doc = self.context_builder.get_dependency_context(dep)
+                cache[dep] = dep_doc
             if dep_doc:
                 contexts.append(f"### {dep}\n\n{dep_doc}")
 
-        return "\n\n".join(contexts) if contexts else ""
+        joined = "\n\n".join(contexts) if contexts else ""
+        self._dep_ctx_joined[deps] = joined
+        return joined
 
     def generate_diagrams(
         self, progress: Optional[Progress] = None, task_id: Optional[TaskID] = None
@@ -466,12 +694,17 @@ Return ONLY the markdown documentation for this function, starting with a level
         if progress and task_id is not None:
             progress.update(task_id, total=total)
 
+        update_every = max(1, total // 200)
         for i, (file_path, analysis) in enumerate(self._analyses.items()):
             if progress:
+                refresh = (i + 1) % update_every == 0 or i + 1 == total
                 desc = f"Diagrams {file_path.name}"
                 if task_id is not None:
-                    progress.update(task_id, description=desc, advance=1)
-                else:
+                    if refresh:
+                        progress.update(task_id, description=desc, advance=1)
+                    else:
+                        progress.update(task_id, advance=1)
+                elif refresh:
                     progress.update(
                         progress.task_ids[0],
                         description=f"Diagrams [{i+1}/{total}] {file_path.name}",
@@ -5,6 +5,10 @@ Builds rich context information for chunks by analyzing dependencies
 and cross-referencing with other documented symbols.
 """
 
+import functools
+import re
+import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +17,50 @@ from autodocgen.parser.models import CppFileAnalysis, ClassInfo
 from autodocgen.chunker.models import CodeChunk, ChunkContext
 
 
+# Hoisted out of the per-call path: _add_used_types runs these over every
+# parameter, return type, and member of every class.
+_QUALIFIER_RE = re.compile(r"\b(?:const|volatile|struct|class|enum)\s+|[&*]")
+
+_BASE_SPECIFIER_RE = re.compile(r"\b(?:public|protected|private|virtual)\s+")
+
+_BUILTIN_TYPES = frozenset({
+    "void", "bool", "char", "short", "int", "long", "float", "double",
+    "size_t", "int8_t", "int16_t", "int32_t", "int64_t",
+    "uint8_t", "uint16_t", "uint32_t", "uint64_t",
+    "string", "wstring", "u16string", "u32string",
+    "auto", "nullptr_t",
+})
+
+
+@functools.lru_cache(maxsize=8192)
+def _extract_type_name(type_spelling: str) -> str:
+    """Extract the base type name from a type spelling."""
+    # Strip qualifiers in one precompiled-regex pass
+    type_name = _QUALIFIER_RE.sub("", type_spelling)
+
+    # Handle templates - get the primary type
+    if "<" in type_name:
+        type_name = type_name[:type_name.index("<")]
+
+    # Handle namespaced types
+    return type_name.strip()
+
+
+@functools.lru_cache(maxsize=8192)
+def _used_type_name(type_spelling: str) -> str:
+    """
+    Extract-and-filter for _add_used_types: cleaned name, "" for builtins.
+
+    A codebase reuses the same few hundred type spellings across
+    thousands of parameters, so distinct spellings are cleaned once and
+    repeated lookups are a dict hit.
+    """
+    type_name = _extract_type_name(type_spelling)
+    if not type_name or type_name.lower() in _BUILTIN_TYPES or type_name.startswith("std::"):
+        return ""
+    return type_name
+
+
 class ContextBuilder:
     """
     Builds rich context for code chunks by cross-referencing symbols.
@@ -31,27 +79,70 @@ class ContextBuilder:
         self.config = config
         self._symbol_docs: dict[str, str] = {}  # Cache of symbol -> documentation
         self._class_cache: dict[str, ClassInfo] = {}  # Cache of qualified_name -> ClassInfo
+        # Symbol -> 100-char doc preview, truncated once instead of per chunk
+        self._symbol_briefs: dict[str, str] = {}
+        # Analyses registered but not yet walked into the symbol dicts;
+        # the lock keeps concurrent enrichers from observing a
+        # half-built index
+        self._pending: list[CppFileAnalysis] = []
+        self._index_lock = threading.Lock()
 
     def register_analysis(self, analysis: CppFileAnalysis) -> None:
         """
         Register symbols from a file analysis for cross-referencing.
 
+        O(1): the analysis is queued and its symbols are indexed lazily on
+        the first lookup, so parse_all does not walk every class and
+        function of the codebase before documentation work begins.
+
         Args:
             analysis: Parsed file analysis to register
         """
+        self._pending.append(analysis)
+
+    def _ensure_indexed(self) -> None:
+        """Index any pending analyses into the symbol dicts.
+
+        Callers may run on ThreadPoolExecutor workers, so indexing is
+        serialized: a thread that arrives while another is indexing
+        blocks until the symbol dicts are complete instead of reading
+        them half-built.
+        """
+        if not self._pending:
+            return
+        with self._index_lock:
+            pending = self._pending
+            if not pending:
+                return
+            for analysis in pending:
+                self._index_analysis(analysis)
+            # Cleared only once the dicts are complete, so the unguarded
+            # fast path above cannot report done while indexing runs
+            self._pending = []
+
+    def _index_analysis(self, analysis: CppFileAnalysis) -> None:
+        """Walk one analysis into the symbol caches."""
+        # Interning qualified names makes both caches share one string per
+        # symbol with the analysis objects, and keys hash-compare by
+        # identity on lookup.
         for cls in analysis.all_classes:
-            self._class_cache[cls.qualified_name] = cls
+            qn = sys.intern(cls.qualified_name)
+            self._class_cache[qn] = cls
             if cls.documentation:
-                self._symbol_docs[cls.qualified_name] = cls.documentation
+                self._symbol_docs[qn] = cls.documentation
+                self._symbol_briefs.pop(qn, None)
 
             for method in cls.methods:
-                method_key = f"{cls.qualified_name}::{method.name}"
                 if method.documentation:
+                    method_key = sys.intern(f"{qn}::{method.name}")
                     self._symbol_docs[method_key] = method.documentation
+                    self._symbol_briefs.pop(method_key, None)
 
         for func in analysis.all_functions:
             if func.documentation:
-                self._symbol_docs[func.qualified_name] = func.documentation
+                fqn = sys.intern(func.qualified_name)
+                self._symbol_docs[fqn] = func.documentation
+                self._symbol_briefs.pop(fqn, None)
 
     def enrich_chunk_context(
         self,
@@ -65,14 +156,13 @@ class ContextBuilder:
             chunk: The chunk to enrich
             analysis: The file analysis
         """
+        self._ensure_indexed()
         context = chunk.context
 
         # Add dependency descriptions
         for dep in context.dependencies:
             if dep in self._symbol_docs:
-                context.dependency_descriptions[dep] = self._truncate(
-                    self._symbol_docs[dep], 100
-                )
+                context.dependency_descriptions[dep] = self._brief(dep)
             elif dep in self._class_cache:
                 cls = self._class_cache[dep]
                 context.dependency_descriptions[dep] = cls.brief_description or ""
@@ -80,9 +170,7 @@ class ContextBuilder:
         # Add descriptions for related types
         for type_name in context.related_types:
             if type_name in self._symbol_docs:
-                context.type_descriptions[type_name] = self._truncate(
-                    self._symbol_docs[type_name], 100
-                )
+                context.type_descriptions[type_name] = self._brief(type_name)
 
         # If this is a class chunk, add base class info
         if chunk.class_info and chunk.class_info.base_classes:
@@ -98,6 +186,10 @@ class ContextBuilder:
         if chunk.class_info:
             self._add_used_types(chunk, chunk.class_info)
 
+        # Enrichment mutated the context (possibly a cached chunk's), so
+        # any previously rendered header is stale
+        context.invalidate_header()
+
     def get_dependency_context(
         self,
         symbol: str,
@@ -116,6 +208,7 @@ class ContextBuilder:
         Returns:
             Markdown-formatted context string
         """
+        self._ensure_indexed()
         if method_name:
             full_symbol = f"{symbol}::{method_name}"
             if full_symbol in self._symbol_docs:
@@ -153,61 +246,55 @@ class ContextBuilder:
         """Add types used by a class to the chunk context."""
         types_used: set[str] = set()
 
-        # From method parameters
+        # From method parameters and return types
         for method in cls.methods:
             for param in method.parameters:
-                type_name = self._extract_type_name(param.type_spelling)
-                if type_name and not self._is_builtin_type(type_name):
+                type_name = self._used_type_name(param.type_spelling)
+                if type_name:
                     types_used.add(type_name)
 
-            # From return types
-            ret_type = self._extract_type_name(method.return_type_spelling)
-            if ret_type and not self._is_builtin_type(ret_type):
+            ret_type = self._used_type_name(method.return_type_spelling)
+            if ret_type:
                 types_used.add(ret_type)
 
         # From member types
         for member in cls.members:
-            type_name = self._extract_type_name(member.type_spelling)
-            if type_name and not self._is_builtin_type(type_name):
+            type_name = self._used_type_name(member.type_spelling)
+            if type_name:
                 types_used.add(type_name)
 
         chunk.context.related_types = list(types_used)
 
+    def _used_type_name(self, type_spelling: str) -> str:
+        """Memoized extract-and-filter for _add_used_types."""
+        return _used_type_name(type_spelling)
+
     def _extract_type_name(self, type_spelling: str) -> str:
         """Extract the base type name from a type spelling."""
-        type_name = type_spelling
-
-        # Remove qualifiers
-        for remove in ["const ", "volatile ", "&", "*", "&&", "struct ", "class ", "enum "]:
-            type_name = type_name.replace(remove, "")
-
-        # Handle templates - get the primary type
-        if "<" in type_name:
-            type_name = type_name[:type_name.index("<")]
-
-        # Handle namespaced types
-        type_name = type_name.strip()
-
-        return type_name
+        return _extract_type_name(type_spelling)
 
     def _extract_base_name(self, base_spelling: str) -> str:
         """Extract clean base class name."""
-        # Remove access specifiers if present
-        for spec in ["public ", "protected ", "private ", "virtual "]:
-            base_spelling = base_spelling.replace(spec, "")
-
-        return base_spelling.strip()
+        # Remove access specifiers in one precompiled-regex pass
+        return _BASE_SPECIFIER_RE.sub("", base_spelling).strip()
 
     def _is_builtin_type(self, type_name: str) -> bool:
         """Check if a type is a C++ builtin."""
-        builtins = {
-            "void", "bool", "char", "short", "int", "long", "float", "double",
-            "size_t", "int8_t", "int16_t", "int32_t", "int64_t",
-            "uint8_t", "uint16_t", "uint32_t", "uint64_t",
-            "string", "wstring", "u16string", "u32string",
-            "auto", "nullptr_t",
-        }
-        return type_name.lower() in builtins or type_name.startswith("std::")
+        return type_name.lower() in _BUILTIN_TYPES or type_name.startswith("std::")
+
+    def _brief(self, symbol: str) -> str:
+        """
+        Truncated doc preview for a symbol, computed once.
+
+        Popular dependencies appear in thousands of chunk contexts;
+        slicing their documentation on every enrichment re-did the same
+        work and allocated a fresh string each time.
+        """
+        brief = self._symbol_briefs.get(symbol)
+        if brief is None:
+            brief = self._truncate(self._symbol_docs[symbol], 100)
+            self._symbol_briefs[symbol] = brief
+        return brief
 
     def _truncate(self, text: str, max_length: int) -> str:
         """Truncate text to max length."""
@@ -5,10 +5,17 @@ Splits large files into logical chunks that can be processed by the LLM
 while preserving semantic context and relationships.
 """
 
+import bisect
+import functools
 import hashlib
+import os
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 from autodocgen.config import Config
 from autodocgen.parser.models import (
@@ -19,6 +26,118 @@ from autodocgen.parser.models import (
 )
 from autodocgen.chunker.models import CodeChunk, ChunkContext
 
+# Bump when chunking logic changes in a way that invalidates cached chunks
+CHUNKER_VERSION = "2"
+
+# Qualifier keywords stripped by regex; single-char decorators go
+# through str.translate, a branchless C-level table lookup
+_TYPE_WORDS_RE = re.compile(r"\b(?:const|volatile)\b\s*")
+_TYPE_CHARS = str.maketrans("", "", "&*")
+
+# Common prefixes in Android/kernel code, longest-first so the
+# alternation prefers the most specific match; the lookahead requires a
+# camelCase or snake_case boundary and is deliberately case-sensitive
+# while the prefix itself is not
+_FUNCTION_PREFIX_RE = re.compile(
+    r"^(?i:(dispatch|validate|destroy|process|handle|should|notify|update"
+    r"|create|parse|init|has|can|get|set|is|do|on))(?=[A-Z_])"
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def _extract_type_name(type_spelling: str) -> str:
+    """
+    Extract the base type name (namespace stripped) from a type spelling.
+
+    Distinct spellings repeat across a class's parameters, so each is
+    cleaned once and later calls are a dict hit.
+    """
+    # Strip qualifier words, then reference/pointer chars via translate
+    type_name = _TYPE_WORDS_RE.sub("", type_spelling).translate(_TYPE_CHARS)
+
+    # Remove template arguments
+    i = type_name.find("<")
+    if i >= 0:
+        type_name = type_name[:i]
+
+    # Remove namespace for checking
+    j = type_name.rfind("::")
+    if j >= 0:
+        type_name = type_name[j + 2:]
+
+    return type_name.strip()
+
+
+@functools.lru_cache(maxsize=8192)
+def _get_function_prefix(name: str) -> str:
+    """
+    Extract a grouping prefix from a function name.
+
+    One anchored regex match replaces the per-name scan over the prefix
+    list, and results are memoized since many functions share names
+    across overloads and files.
+    """
+    m = _FUNCTION_PREFIX_RE.match(name)
+    if m:
+        return m.group(1).lower()
+
+    # Try to split on underscore
+    if "_" in name:
+        return name.partition("_")[0]
+
+    return ""
+
+
+def _line_offsets(source_code: str) -> list[int]:
+    """
+    Start offset of each line in source_code, plus a sentinel.
+
+    offsets[i] is the character offset where line i+1 begins, so the
+    text of lines a..b (1-based, inclusive) is a single slice of the
+    source instead of a join over a list-of-lines copy.
+    """
+    offsets = [0]
+    pos = source_code.find("\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = source_code.find("\n", pos + 1)
+    # Sentinel one past the end so slicing the last line needs no special case
+    offsets.append(len(source_code) + 1)
+    return offsets
+
+
+class _SourceLines:
+    """
+    Lazy line view over a source string via its offset table.
+
+    Indexing and len() behave like source_code.splitlines(), but lines
+    are sliced out of the source on demand instead of all being copied
+    into a list up front; only the handful of lines the split-point
+    search actually inspects are ever materialized.
+    """
+
+    __slots__ = ("_source", "_offsets", "_count")
+
+    def __init__(self, source: str, offsets: list[int]):
+        self._source = source
+        self._offsets = offsets
+        if not source:
+            self._count = 0
+        elif source.endswith("\n"):
+            self._count = len(offsets) - 2
+        else:
+            self._count = len(offsets) - 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._source[self._offsets[index]:self._offsets[index + 1] - 1]
+
 
 @dataclass
 class ChunkBoundary:
@@ -53,11 +172,26 @@ class IntelligentChunker:
         self.context_lines = config.chunker.context_lines
         self.overlap_lines = config.chunker.overlap_lines
 
+        # On-disk cache of chunk lists so unchanged sources skip
+        # boundary analysis and context building on re-runs
+        self._cache_dir = config.cache_path / "chunk_cache"
+        fingerprint_parts = [
+            CHUNKER_VERSION,
+            str(self.max_lines),
+            str(self.min_lines),
+            str(self.context_lines),
+            str(self.overlap_lines),
+        ]
+        self._config_fingerprint = hashlib.blake2b(
+            "|".join(fingerprint_parts).encode(), digest_size=8
+        ).hexdigest()
+
     def chunk_file(
         self,
         file_path: Path,
         analysis: CppFileAnalysis,
         source_code: str,
+        on_chunk: Optional[Callable[[CodeChunk], None]] = None,
     ) -> list[CodeChunk]:
         """
         Chunk a C++ file into logical segments.
@@ -66,124 +200,313 @@ class IntelligentChunker:
             file_path: Path to the source file
             analysis: Parsed analysis of the file
             source_code: The raw source code
+            on_chunk: Optional callback invoked on each chunk as it is
+                built (e.g. context enrichment), fusing per-chunk
+                post-processing into this pass instead of a second loop
 
         Returns:
             List of CodeChunk objects ready for LLM processing
+
+        Results are cached on disk keyed by the source content hash plus
+        the chunker version and settings, so unchanged files skip
+        boundary analysis entirely on re-runs. The on_chunk callback
+        still runs per chunk on a cache hit, since enrichment depends on
+        cross-file state that is not part of the cache key.
         """
-        lines = source_code.splitlines()
+        cache_key = self._cache_key(file_path, source_code)
+
+        cached = self._load_cached_chunks(file_path, cache_key)
+        if cached is not None:
+            if on_chunk:
+                for chunk in cached:
+                    on_chunk(chunk)
+            return cached
+
+        chunks = list(self._build_chunks(file_path, analysis, source_code, on_chunk))
+        self._store_cached_chunks(file_path, cache_key, chunks)
+
+        return chunks
+
+    def chunk_files(
+        self,
+        items: list[tuple[Path, CppFileAnalysis, str]],
+    ) -> dict[Path, list[CodeChunk]]:
+        """
+        Chunk a batch of files, fanning out across worker processes.
+
+        Chunking is pure CPU work (boundary analysis and string
+        slicing), so batches scale with cores once parsing is cached.
+        Worker count follows the analyzer's convention: bounded by the
+        batch size, config.parallel_workers, and the machine. Falls back
+        to serial chunking for single workers. No on_chunk callback is
+        taken here since callbacks cannot cross process boundaries;
+        enrich returned chunks in the caller.
+
+        Args:
+            items: (file_path, analysis, source_code) per file
+
+        Returns:
+            Mapping of file path to its chunk list
+        """
+        if not items:
+            return {}
+
+        max_workers = min(
+            len(items), max(1, self.config.parallel_workers), os.cpu_count() or 1
+        )
+
+        if max_workers <= 1:
+            return {
+                file_path: self.chunk_file(file_path, analysis, source_code)
+                for file_path, analysis, source_code in items
+            }
+
+        results: dict[Path, list[CodeChunk]] = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self.chunk_file, file_path, analysis, source_code): file_path
+                for file_path, analysis, source_code in items
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
+
+    def iter_chunks(
+        self,
+        file_path: Path,
+        analysis: CppFileAnalysis,
+        source_code: str,
+        on_chunk: Optional[Callable[[CodeChunk], None]] = None,
+    ) -> Iterator[CodeChunk]:
+        """
+        Stream chunks one at a time instead of materializing the list.
+
+        Useful when chunks are consumed sequentially (e.g. piped to the
+        LLM one by one), keeping peak memory at one chunk rather than
+        the whole file's worth. Cache hits are served from disk; misses
+        are built lazily and not written back, since storing would
+        require holding the full list anyway — batch callers that want
+        the cache should use chunk_file.
+        """
+        cached = self._load_cached_chunks(
+            file_path, self._cache_key(file_path, source_code)
+        )
+        if cached is not None:
+            for chunk in cached:
+                if on_chunk:
+                    on_chunk(chunk)
+                yield chunk
+            return
+
+        yield from self._build_chunks(file_path, analysis, source_code, on_chunk)
+
+    def _cache_key(self, file_path: Path, source_code: str) -> tuple:
+        """Cache key covering the source content and chunker settings."""
+        source_hash = hashlib.blake2b(source_code.encode(), digest_size=16).hexdigest()
+        return (str(file_path), source_hash, self._config_fingerprint)
+
+    def _build_chunks(
+        self,
+        file_path: Path,
+        analysis: CppFileAnalysis,
+        source_code: str,
+        on_chunk: Optional[Callable[[CodeChunk], None]] = None,
+    ) -> Iterator[CodeChunk]:
+        """Generate chunks for a file, yielding each as it is built."""
+        # One offset scan replaces splitlines(); lines are viewed lazily
+        offsets = _line_offsets(source_code)
+        lines = _SourceLines(source_code, offsets)
         total_lines = len(lines)
 
+        # Shared by every chunk context of this file
+        includes_summary = self._includes_summary(analysis)
+
         # For small files, just return a single chunk
         if total_lines <= self.max_lines:
-            return self._create_single_chunk(file_path, analysis, source_code, lines)
+            yield from self._create_single_chunk(
+                file_path, analysis, source_code, lines, includes_summary, on_chunk
+            )
+            return
 
         # Identify logical boundaries
         boundaries = self._identify_boundaries(analysis)
 
         # Create chunks based on boundaries
-        chunks = self._create_chunks_from_boundaries(
-            file_path, analysis, source_code, lines, boundaries
+        yield from self._create_chunks_from_boundaries(
+            file_path, analysis, source_code, lines, offsets,
+            boundaries, includes_summary, on_chunk,
         )
 
+    def _chunk_cache_path(self, file_path: Path) -> Path:
+        """Get the cache file path for a source file."""
+        name = hashlib.blake2b(str(file_path).encode(), digest_size=16).hexdigest()
+        return self._cache_dir / f"{name}.pkl"
+
+    def _load_cached_chunks(
+        self, file_path: Path, cache_key: tuple
+    ) -> Optional[list[CodeChunk]]:
+        """Load cached chunks if they match the cache key."""
+        cache_path = self._chunk_cache_path(file_path)
+        try:
+            with open(cache_path, "rb") as f:
+                stored_key, chunks = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+            return None
+
+        if stored_key != cache_key:
+            return None
         return chunks
 
+    def _store_cached_chunks(
+        self, file_path: Path, cache_key: tuple, chunks: list[CodeChunk]
+    ) -> None:
+        """Persist a chunk list for reuse on unchanged sources."""
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._chunk_cache_path(file_path), "wb") as f:
+                pickle.dump((cache_key, chunks), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError):
+            pass  # Cache is best-effort; chunking already succeeded
+
     def _identify_boundaries(self, analysis: CppFileAnalysis) -> list[ChunkBoundary]:
         """Identify logical chunk boundaries in the file."""
-        boundaries: list[ChunkBoundary] = []
-
-        # Classes are primary boundaries
-        for cls in analysis.all_classes:
-            if cls.location:
-                boundaries.append(ChunkBoundary(
-                    line_start=cls.location.line_start,
-                    line_end=cls.location.line_end,
-                    symbol_name=cls.qualified_name,
-                    symbol_type="class",
-                ))
+        # Classes are primary boundaries; symbols without a location are
+        # filtered inside the comprehensions instead of per-append checks
+        boundaries: list[ChunkBoundary] = [
+            ChunkBoundary(
+                line_start=cls.location.line_start,
+                line_end=cls.location.line_end,
+                symbol_name=cls.qualified_name,
+                symbol_type="class",
+            )
+            for cls in analysis.all_classes
+            if cls.location
+        ]
 
-        # Free functions grouped by prefix or proximity
+        # Free functions grouped by prefix or proximity; line spans come
+        # pre-aggregated from the grouping pass
         function_groups = self._group_functions(analysis.all_functions)
-        for group_name, functions in function_groups.items():
-            if functions:
-                start = min(f.location.line_start for f in functions if f.location)
-                end = max(f.location.line_end for f in functions if f.location)
-                boundaries.append(ChunkBoundary(
-                    line_start=start,
-                    line_end=end,
-                    symbol_name=group_name,
-                    symbol_type="function_group",
-                ))
+        for group_name, (start, end, _functions) in function_groups.items():
+            boundaries.append(ChunkBoundary(
+                line_start=start,
+                line_end=end,
+                symbol_name=group_name,
+                symbol_type="function_group",
+            ))
 
         # Namespaces as boundaries
-        for ns in analysis.namespaces:
-            if ns.location:
-                boundaries.append(ChunkBoundary(
-                    line_start=ns.location.line_start,
-                    line_end=ns.location.line_end,
-                    symbol_name=ns.qualified_name,
-                    symbol_type="namespace",
-                ))
+        boundaries.extend(
+            ChunkBoundary(
+                line_start=ns.location.line_start,
+                line_end=ns.location.line_end,
+                symbol_name=ns.qualified_name,
+                symbol_type="namespace",
+            )
+            for ns in analysis.namespaces
+            if ns.location
+        )
+
+        # Sort outermost-first; inputs are already roughly ordered, which
+        # Timsort exploits
+        boundaries.sort(key=lambda b: (b.line_start, -b.line_end))
 
-        # Sort by start line
-        boundaries.sort(key=lambda b: b.line_start)
+        return self._resolve_overlaps(boundaries)
 
-        return boundaries
+    def _resolve_overlaps(
+        self, boundaries: list[ChunkBoundary]
+    ) -> list[ChunkBoundary]:
+        """
+        Drop nested duplicates from an outermost-first boundary list.
+
+        Namespace boundaries contain their classes and classes contain
+        their methods' function groups, so the raw list documents the
+        same lines more than once. For each contained boundary: if the
+        enclosing one already fits in a single chunk, the inner is
+        redundant and dropped; if the enclosing one would have to be
+        split anyway, it is dropped in favour of its children. Partial
+        overlaps are left for the merge/split passes.
+        """
+        if len(boundaries) < 2:
+            return boundaries
+
+        kept: list[ChunkBoundary] = []
+        for boundary in boundaries:
+            drop_child = False
+            while kept:
+                parent = kept[-1]
+                if (
+                    boundary.line_start >= parent.line_start
+                    and boundary.line_end <= parent.line_end
+                ):
+                    if parent.line_end - parent.line_start + 1 <= self.max_lines:
+                        drop_child = True
+                        break
+                    # Parent is oversized; prefer its children
+                    kept.pop()
+                else:
+                    break
+            if not drop_child:
+                kept.append(boundary)
+
+        return kept
 
     def _group_functions(
         self, functions: list[FunctionInfo]
-    ) -> dict[str, list[FunctionInfo]]:
-        """Group functions by common prefix or proximity."""
+    ) -> dict[str, list]:
+        """
+        Group functions by common prefix or proximity.
+
+        Each value is [min_line_start, max_line_end, functions]: the
+        group's line span is tracked inline while grouping so callers
+        need no second min()/max() pass. Functions without a location
+        are skipped since they cannot contribute to a boundary.
+        """
         if not functions:
             return {}
 
-        groups: dict[str, list[FunctionInfo]] = {}
+        groups: dict[str, list] = {}
 
         for func in functions:
+            if not func.location:
+                continue
+
             # Disable prefix grouping to avoid massive chunks spanning unrelated functions
             # prefix = self._get_function_prefix(func.name)
             prefix = ""
-            
+
             if prefix:
                 group_name = f"{prefix}_functions"
             else:
                 # Use function name for ungrouped functions to avoid large miscellaneous chunks
                 group_name = func.qualified_name
 
-            if group_name not in groups:
-                groups[group_name] = []
-            groups[group_name].append(func)
+            line_start = func.location.line_start
+            line_end = func.location.line_end
+            group = groups.get(group_name)
+            if group is None:
+                groups[group_name] = [line_start, line_end, [func]]
+            else:
+                if line_start < group[0]:
+                    group[0] = line_start
+                if line_end > group[1]:
+                    group[1] = line_end
+                group[2].append(func)
 
         return groups
 
     def _get_function_prefix(self, name: str) -> str:
         """Extract a grouping prefix from a function name."""
-        # Common prefixes in Android/kernel code
-        prefixes = [
-            "on", "handle", "do", "process", "init", "destroy",
-            "create", "get", "set", "is", "has", "can", "should",
-            "update", "notify", "dispatch", "validate", "parse",
-        ]
-
-        name_lower = name.lower()
-        for prefix in prefixes:
-            if name_lower.startswith(prefix) and len(name) > len(prefix):
-                # Check if it's a camelCase or snake_case boundary
-                next_char = name[len(prefix)]
-                if next_char.isupper() or next_char == "_":
-                    return prefix
-
-        # Try to split on underscore
-        if "_" in name:
-            return name.split("_")[0]
-
-        return ""
+        return _get_function_prefix(name)
 
     def _create_single_chunk(
         self,
         file_path: Path,
         analysis: CppFileAnalysis,
         source_code: str,
-        lines: list[str],
+        lines: _SourceLines,
+        includes_summary: str,
+        on_chunk: Optional[Callable[[CodeChunk], None]] = None,
     ) -> list[CodeChunk]:
         """Create a single chunk for a small file."""
         context = self._build_context(
@@ -193,12 +516,13 @@ class IntelligentChunker:
             total_chunks=1,
             primary_ns="",
             primary_class=None,
+            includes_summary=includes_summary,
         )
 
-        chunk_id = self._generate_chunk_id(file_path, 0)
+        chunk_id = self._generate_chunk_id(self._id_prefix(file_path), 0)
         symbols = self._extract_symbol_names(analysis)
 
-        return [CodeChunk(
+        chunk = CodeChunk(
             chunk_id=chunk_id,
             file_path=file_path,
             chunk_index=0,
@@ -210,23 +534,38 @@ class IntelligentChunker:
             chunk_type="file",
             primary_symbol=file_path.stem,
             symbols_contained=symbols,
-        )]
+        )
+        if on_chunk:
+            on_chunk(chunk)
+        return [chunk]
 
     def _create_chunks_from_boundaries(
         self,
         file_path: Path,
         analysis: CppFileAnalysis,
         source_code: str,
-        lines: list[str],
+        lines: _SourceLines,
+        offsets: list[int],
         boundaries: list[ChunkBoundary],
-    ) -> list[CodeChunk]:
-        """Create chunks based on identified boundaries."""
+        includes_summary: str,
+        on_chunk: Optional[Callable[[CodeChunk], None]] = None,
+    ) -> Iterator[CodeChunk]:
+        """Create chunks based on identified boundaries, yielding each."""
         if not boundaries:
-            return self._create_single_chunk(file_path, analysis, source_code, lines)
+            yield from self._create_single_chunk(
+                file_path, analysis, source_code, lines, includes_summary, on_chunk
+            )
+            return
 
-        chunks: list[CodeChunk] = []
         total_lines = len(lines)
 
+        # Flattened namespace intervals, built once per file so each
+        # boundary's namespace lookup is a bisect instead of a rescan
+        ns_index = self._build_namespace_index(analysis)
+
+        # Encode the id prefix once instead of f-string formatting per chunk
+        id_prefix = self._id_prefix(file_path)
+
         # Merge small adjacent boundaries
         merged = self._merge_small_boundaries(boundaries, total_lines)
 
@@ -236,14 +575,17 @@ class IntelligentChunker:
         total_chunks = len(final_boundaries)
 
         # Debug: Print chunk boundaries
-        print(f"[debug] Created {total_chunks} chunks for {file_path.name}:")
-        for b in final_boundaries:
-            print(f"  - Chunk: {b.symbol_name} (lines {b.line_start}-{b.line_end}) Type: {b.symbol_type}")
+        if self.config.verbose:
+            print(f"[debug] Created {total_chunks} chunks for {file_path.name}:")
+            for b in final_boundaries:
+                print(f"  - Chunk: {b.symbol_name} (lines {b.line_start}-{b.line_end}) Type: {b.symbol_type}")
 
         for i, boundary in enumerate(final_boundaries):
-            # Get the code for this boundary
-            chunk_lines = lines[boundary.line_start - 1:boundary.line_end]
-            chunk_code = "\n".join(chunk_lines)
+            # Get the code for this boundary as a single source slice
+            line_end = min(boundary.line_end, total_lines)
+            chunk_code = source_code[
+                offsets[boundary.line_start - 1]:offsets[line_end] - 1
+            ]
 
             # Find associated class if this is a class chunk
             class_info = None
@@ -256,15 +598,14 @@ class IntelligentChunker:
                 analysis=analysis,
                 chunk_index=i,
                 total_chunks=total_chunks,
-                primary_ns=self._get_namespace_for_line(
-                    analysis, boundary.line_start
-                ),
+                primary_ns=self._namespace_for_line(ns_index, boundary.line_start),
                 primary_class=class_info,
+                includes_summary=includes_summary,
             )
 
-            chunk_id = self._generate_chunk_id(file_path, i)
+            chunk_id = self._generate_chunk_id(id_prefix, i)
 
-            chunks.append(CodeChunk(
+            chunk = CodeChunk(
                 chunk_id=chunk_id,
                 file_path=file_path,
                 chunk_index=i,
@@ -276,9 +617,10 @@ class IntelligentChunker:
                 chunk_type=boundary.symbol_type,
                 primary_symbol=boundary.symbol_name,
                 class_info=class_info,
-            ))
-
-        return chunks
+            )
+            if on_chunk:
+                on_chunk(chunk)
+            yield chunk
 
     def _merge_small_boundaries(
         self,
@@ -290,37 +632,57 @@ class IntelligentChunker:
             return []
 
         merged: list[ChunkBoundary] = []
+
+        # Run sizes forward instead of recomputing them per comparison,
+        # and only build a merged ChunkBoundary when a run is flushed
+        # rather than one intermediate object per absorbed neighbour
         current = boundaries[0]
+        current_start = current.line_start
+        current_size = current.line_end - current_start + 1
+        name_parts = [current.symbol_name]
 
+        def flush(line_end: int) -> None:
+            if len(name_parts) == 1:
+                merged.append(current)
+            else:
+                merged.append(ChunkBoundary(
+                    line_start=current_start,
+                    line_end=line_end,
+                    symbol_name="+".join(name_parts),
+                    symbol_type="mixed",
+                ))
+
+        current_end = current.line_end
         for next_boundary in boundaries[1:]:
-            current_size = current.line_end - current.line_start + 1
             next_size = next_boundary.line_end - next_boundary.line_start + 1
-            combined_size = next_boundary.line_end - current.line_start + 1
+            combined_size = next_boundary.line_end - current_start + 1
 
-            # Merge if combined is still under max and both are small
+            # Merge if combined is still under max and either is small
             if combined_size <= self.max_lines and (
                 current_size < self.min_lines or next_size < self.min_lines
             ):
-                current = ChunkBoundary(
-                    line_start=current.line_start,
-                    line_end=next_boundary.line_end,
-                    symbol_name=f"{current.symbol_name}+{next_boundary.symbol_name}",
-                    symbol_type="mixed",
-                )
+                current_end = next_boundary.line_end
+                current_size = combined_size
+                name_parts.append(next_boundary.symbol_name)
             else:
-                merged.append(current)
+                flush(current_end)
                 current = next_boundary
+                current_start = current.line_start
+                current_end = current.line_end
+                current_size = next_size
+                name_parts = [current.symbol_name]
 
-        merged.append(current)
+        flush(current_end)
         return merged
 
     def _split_large_boundaries(
         self,
         boundaries: list[ChunkBoundary],
-        lines: list[str],
+        lines: _SourceLines,
     ) -> list[ChunkBoundary]:
         """Split boundaries that are too large."""
         result: list[ChunkBoundary] = []
+        break_kinds: Optional[bytes] = None
 
         for boundary in boundaries:
             size = boundary.line_end - boundary.line_start + 1
@@ -328,9 +690,12 @@ class IntelligentChunker:
             if size <= self.max_lines:
                 result.append(boundary)
             else:
+                if break_kinds is None:
+                    break_kinds = self._break_kinds(lines)
+
                 # Split at logical points (method boundaries, etc.)
                 splits = self._find_split_points(
-                    lines,
+                    break_kinds,
                     boundary.line_start,
                     boundary.line_end,
                     self.max_lines,
@@ -346,9 +711,28 @@ class IntelligentChunker:
 
         return result
 
+    def _break_kinds(self, lines: _SourceLines) -> bytes:
+        """
+        Per-line break eligibility, classified once per file.
+
+        1 marks a line that is itself a good break (empty or opening
+        with a closing brace), 2 marks a line a break should land just
+        before (ends an opening brace). The split search then scans this
+        table with bytes.rfind instead of re-stripping and re-testing
+        each line per split point.
+        """
+        kinds = bytearray(len(lines))
+        for i in range(len(lines)):
+            line = lines[i].strip()
+            if not line or line.startswith("}"):
+                kinds[i] = 1
+            elif line.endswith("{"):
+                kinds[i] = 2
+        return bytes(kinds)
+
     def _find_split_points(
         self,
-        lines: list[str],
+        break_kinds: bytes,
         start: int,
         end: int,
         max_size: int,
@@ -362,7 +746,7 @@ class IntelligentChunker:
 
             # Try to find a good split point (empty line, closing brace, etc.)
             actual_end = self._find_natural_break(
-                lines, current_start, target_end, end
+                break_kinds, current_start, target_end, end
             )
 
             splits.append((current_start, actual_end))
@@ -372,27 +756,24 @@ class IntelligentChunker:
 
     def _find_natural_break(
         self,
-        lines: list[str],
+        break_kinds: bytes,
         start: int,
         target: int,
         max_end: int,
     ) -> int:
         """Find a natural break point near the target line."""
-        # Search backwards from target for a good break
-        for line_num in range(target, start, -1):
-            line = lines[line_num - 1].strip()
-
-            # Empty line is a good break
-            if not line:
-                return line_num
-
-            # Closing brace at start of line
-            if line.startswith("}"):
-                return line_num
-
-            # End of function/method definition
-            if line.endswith("{"):
-                return line_num - 1 if line_num > start else line_num
+        # Search backwards from target for a good break: the nearest
+        # eligible line wins, found with two C-level rfind scans over
+        # lines start+1..target (0-based indices start..target-1)
+        at_line = break_kinds.rfind(b"\x01", start, target)
+        before_line = break_kinds.rfind(b"\x02", start, target)
+
+        if before_line > at_line:
+            # End of function/method definition: break just before it
+            return before_line
+        if at_line != -1:
+            # Empty line or closing brace at start of line
+            return at_line + 1
 
         # If no good break found, just use target
         return min(target, max_end)
@@ -405,24 +786,26 @@ class IntelligentChunker:
         total_chunks: int,
         primary_ns: str,
         primary_class: Optional[ClassInfo],
+        includes_summary: str,
     ) -> ChunkContext:
         """Build context information for a chunk."""
-        # Get includes summary
-        includes = [inc.path for inc in analysis.includes if not inc.is_system]
-        includes_summary = ", ".join(includes[:5])
-        if len(includes) > 5:
-            includes_summary += f"... (+{len(includes) - 5} more)"
-
-        # Get dependencies from class
+        # Get dependencies from class, deduplicated via a parallel set
+        # and capped early rather than list-scanning per parameter
         dependencies: list[str] = []
         if primary_class:
             dependencies = list(primary_class.base_classes)
+            seen = set(dependencies)
             # Add types used in methods
             for method in primary_class.methods:
+                if len(dependencies) >= 10:
+                    break
                 for param in method.parameters:
                     type_name = self._extract_type_name(param.type_spelling)
-                    if type_name and type_name not in dependencies:
+                    if type_name and type_name not in seen:
+                        seen.add(type_name)
                         dependencies.append(type_name)
+                        if len(dependencies) >= 10:
+                            break
 
         return ChunkContext(
             file_path=file_path,
@@ -435,58 +818,80 @@ class IntelligentChunker:
             includes_summary=includes_summary,
         )
 
-    def _get_namespace_for_line(
+    def _includes_summary(self, analysis: CppFileAnalysis) -> str:
+        """
+        Summary of non-system includes, built once per file.
+
+        Every chunk of a file shares this string, so it is computed in
+        _build_chunks and threaded through instead of rescanning the
+        include list per chunk context.
+        """
+        includes = [inc.path for inc in analysis.includes if not inc.is_system]
+        includes_summary = ", ".join(includes[:5])
+        if len(includes) > 5:
+            includes_summary += f"... (+{len(includes) - 5} more)"
+        return includes_summary
+
+    def _build_namespace_index(
         self,
         analysis: CppFileAnalysis,
+    ) -> list[tuple[int, int, str]]:
+        """
+        Flatten namespaces (including nested ones) into intervals sorted
+        by start line, for bisect lookup in _namespace_for_line.
+        """
+        intervals: list[tuple[int, int, str]] = []
+
+        def collect(namespaces: list[NamespaceInfo]) -> None:
+            for ns in namespaces:
+                if ns.location:
+                    intervals.append(
+                        (ns.location.line_start, ns.location.line_end, ns.qualified_name)
+                    )
+                collect(ns.nested_namespaces)
+
+        collect(analysis.namespaces)
+        intervals.sort()
+        return intervals
+
+    def _namespace_for_line(
+        self,
+        ns_index: list[tuple[int, int, str]],
         line: int,
     ) -> str:
         """Find which namespace a line belongs to."""
-        for ns in analysis.namespaces:
-            if ns.location:
-                if ns.location.line_start <= line <= ns.location.line_end:
-                    # Check nested namespaces
-                    for nested in ns.nested_namespaces:
-                        if nested.location:
-                            if nested.location.line_start <= line <= nested.location.line_end:
-                                return nested.qualified_name
-                    return ns.qualified_name
+        # The innermost enclosing namespace is the one with the largest
+        # start line whose interval still covers the target line
+        idx = bisect.bisect_right(ns_index, (line, float("inf"))) - 1
+        while idx >= 0:
+            line_start, line_end, qualified_name = ns_index[idx]
+            if line_start <= line <= line_end:
+                return qualified_name
+            idx -= 1
         return ""
 
     def _extract_type_name(self, type_spelling: str) -> str:
-        """Extract the base type name from a type spelling."""
-        # Remove common qualifiers and decorators
-        type_name = type_spelling
-        for remove in ["const ", "volatile ", "&", "*", "&&"]:
-            type_name = type_name.replace(remove, "")
-
-        # Remove template arguments
-        if "<" in type_name:
-            type_name = type_name[:type_name.index("<")]
-
-        # Remove namespace for checking
-        if "::" in type_name:
-            type_name = type_name.split("::")[-1]
-
-        return type_name.strip()
+        """Memoized extract of the base type name from a type spelling."""
+        return _extract_type_name(type_spelling)
 
     def _extract_symbol_names(self, analysis: CppFileAnalysis) -> list[str]:
         """Extract all symbol names from an analysis."""
-        symbols: list[str] = []
-
-        for cls in analysis.all_classes:
-            symbols.append(cls.qualified_name)
-            for method in cls.methods:
-                symbols.append(f"{cls.qualified_name}::{method.name}")
-
-        for func in analysis.all_functions:
-            symbols.append(func.qualified_name)
-
-        for enum in analysis.enums:
-            symbols.append(enum.qualified_name)
-
-        return symbols
-
-    def _generate_chunk_id(self, file_path: Path, index: int) -> str:
+        # One chained comprehension instead of per-append loops
+        return list(chain(
+            (cls.qualified_name for cls in analysis.all_classes),
+            (
+                f"{cls.qualified_name}::{method.name}"
+                for cls in analysis.all_classes
+                for method in cls.methods
+            ),
+            (func.qualified_name for func in analysis.all_functions),
+            (enum.qualified_name for enum in analysis.enums),
+        ))
+
+    def _id_prefix(self, file_path: Path) -> bytes:
+        """Encoded per-file prefix for chunk ids, built once per file."""
+        return f"{file_path}:".encode()
+
+    def _generate_chunk_id(self, id_prefix: bytes, index: int) -> str:
         """Generate a unique ID for a chunk."""
-        content = f"{file_path}:{index}"
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+        return hashlib.blake2b(id_prefix + b"%d" % index, digest_size=6).hexdigest()
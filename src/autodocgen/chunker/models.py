@@ -9,7 +9,7 @@ from typing import Optional
 from autodocgen.parser.models import ClassInfo, FunctionInfo, NamespaceInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkContext:
     """
     Context information for a code chunk.
@@ -35,8 +35,22 @@ class ChunkContext:
     # Includes summary
     includes_summary: str = ""
 
+    # Rendered header memo; LLM retries re-read the header, so it is
+    # built once and invalidated when enrichment mutates the context
+    _header: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     def to_header(self) -> str:
-        """Generate a context header string for the LLM."""
+        """Generate a context header string for the LLM (memoized)."""
+        if self._header is None:
+            self._header = self._render_header()
+        return self._header
+
+    def invalidate_header(self) -> None:
+        """Drop the memoized header after the context is mutated."""
+        self._header = None
+
+    def _render_header(self) -> str:
+        """Render the context header string."""
         lines = [
             "/*",
             f" * FILE: {self.file_path}",
@@ -79,7 +93,7 @@ class ChunkContext:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeChunk:
     """
     A chunk of code to be processed by the LLM.
@@ -5,14 +5,25 @@ All configurations are designed for offline-first, privacy-preserving operation.
 Network access is strictly controlled and defaults to localhost only.
 """
 
+import fnmatch
+import re
+from functools import cached_property
 from pathlib import Path
 from typing import Literal, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+
+# Hosts considered local, shared by host validation and the offline check
+_ALLOWED_HOSTS: frozenset[str] = frozenset({"127.0.0.1", "localhost", "::1"})
 
 
 class LLMConfig(BaseModel):
     """Local LLM configuration - NO external endpoints allowed."""
 
+    model_config = ConfigDict(
+        defer_build=True, validate_default=False, revalidate_instances="never"
+    )
+
     backend: Literal["ollama", "llamacpp"] = Field(
         default="ollama",
         description="LLM backend to use: 'ollama' or 'llamacpp'"
@@ -41,7 +52,7 @@ class LLMConfig(BaseModel):
     # Model settings - DEFAULT TO LIGHTWEIGHT 3B MODEL FOR FASTER GENERATION
     model_name: str = Field(
         default="qwen2.5-coder:3b",
-        description="Model name to use for analysis (default: fast 3B)"
+        description="Model name to use for analysis (default: fast 3B; prefer quantized tags like q4_K_M for lower memory bandwidth)"
     )
     model_path: Optional[Path] = Field(
         default=None,
@@ -74,6 +85,26 @@ class LLMConfig(BaseModel):
         description="Number of layers to offload to GPU (0 = CPU only, 35 = 3B model on 4GB GPU)"
     )
 
+    # Concurrent file documentation - should match Ollama's num_parallel
+    concurrency: int = Field(
+        default=4,
+        description="Number of files documented concurrently (match Ollama num_parallel)"
+    )
+
+    # Embedding settings (semantic cache, context ranking)
+    embed_model: str = Field(
+        default="nomic-embed-text",
+        description="Model name to use for embeddings"
+    )
+    semantic_cache: bool = Field(
+        default=False,
+        description="Reuse responses for near-identical prompts via embedding similarity (requires embed_model pulled in Ollama)"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.97,
+        description="Minimum cosine similarity for a semantic cache hit"
+    )
+
     # Remote LLM server support (for using a separate machine on LAN)
     allow_remote_host: bool = Field(
         default=False,
@@ -84,10 +115,8 @@ class LLMConfig(BaseModel):
     @classmethod
     def validate_host(cls, v: str, info) -> str:
         """Validate host - allow remote only if explicitly enabled."""
-        localhost_values = {"127.0.0.1", "localhost", "::1"}
-        
         # Always allow localhost
-        if v in localhost_values:
+        if v in _ALLOWED_HOSTS:
             return v
         
         # For non-localhost, we'll validate at runtime when allow_remote_host is known
@@ -123,6 +152,10 @@ class LLMConfig(BaseModel):
 class ServerConfig(BaseModel):
     """Web server configuration - localhost by default for privacy."""
 
+    model_config = ConfigDict(
+        defer_build=True, validate_default=False, revalidate_instances="never"
+    )
+
     host: str = Field(
         default="127.0.0.1",
         description="Server host address"
@@ -150,6 +183,10 @@ class ServerConfig(BaseModel):
 class PrivacyConfig(BaseModel):
     """Privacy settings - networking disabled by default."""
 
+    model_config = ConfigDict(
+        defer_build=True, validate_default=False, revalidate_instances="never"
+    )
+
     # Network controls
     allow_any_network: bool = Field(
         default=False,
@@ -198,6 +235,10 @@ class PrivacyConfig(BaseModel):
 class ParserConfig(BaseModel):
     """C++ parser configuration."""
 
+    model_config = ConfigDict(
+        defer_build=True, validate_default=False, revalidate_instances="never"
+    )
+
     supported_extensions: list[str] = Field(
         default=[".cpp", ".cc", ".cxx", ".c", ".h", ".hpp", ".hxx", ".inl"],
         description="File extensions to parse"
@@ -215,10 +256,39 @@ class ParserConfig(BaseModel):
         description="Glob patterns to exclude from parsing"
     )
 
+    @cached_property
+    def exclude_regex(self) -> Optional[re.Pattern]:
+        """
+        One alternation regex covering all exclude_patterns, or None
+        when there are none.
+
+        The globs are translated and compiled on first access, so every
+        consumer pays a single regex match per path instead of a
+        per-pattern fnmatch loop. Cached on the instance: mutate
+        exclude_patterns before the first lookup. A compiled pattern
+        (unlike a closure) survives pickling, which matters because
+        configs ride along into ProcessPoolExecutor workers.
+        """
+        if not self.exclude_patterns:
+            return None
+
+        return re.compile(
+            "|".join(f"(?:{fnmatch.translate(p)})" for p in self.exclude_patterns)
+        )
+
+    def is_excluded(self, path: str) -> bool:
+        """Test a relative path against exclude_patterns."""
+        regex = self.exclude_regex
+        return regex is not None and regex.match(path) is not None
+
 
 class ChunkerConfig(BaseModel):
     """Chunking configuration for large files."""
 
+    model_config = ConfigDict(
+        defer_build=True, validate_default=False, revalidate_instances="never"
+    )
+
     max_chunk_lines: int = Field(
         default=75,
         description="Maximum lines per chunk (reduced for smaller context windows)"
@@ -240,6 +310,10 @@ class ChunkerConfig(BaseModel):
 class DocumentationConfig(BaseModel):
     """Documentation generation configuration."""
 
+    model_config = ConfigDict(
+        defer_build=True, validate_default=False, revalidate_instances="never"
+    )
+
     output_format: Literal["markdown", "html", "both"] = Field(
         default="markdown",
         description="Output format for documentation"
@@ -262,9 +336,17 @@ class DocumentationConfig(BaseModel):
     )
 
 
+# Directories already created by ensure_directories this process
+_ensured_directories: set[Path] = set()
+
+
 class Config(BaseModel):
     """Main configuration for AutoDocGen."""
 
+    model_config = ConfigDict(
+        defer_build=True, validate_default=False, revalidate_instances="never"
+    )
+
     # Paths
     codebase_path: Path = Field(
         description="Path to the C++ codebase to document"
@@ -299,48 +381,119 @@ class Config(BaseModel):
         default=10,
         description="Batch size for LLM requests"
     )
+    verbose: bool = Field(
+        default=False,
+        description="Print per-chunk debug output during generation"
+    )
+
+    # Set once validate_offline_mode has checked this instance
+    _offline_validated: bool = PrivateAttr(default=False)
 
     def validate_offline_mode(self) -> bool:
-        """Verify configuration is safe for offline operation."""
-        assert self.llm.ollama_host in ["127.0.0.1", "localhost", "::1"]
-        assert self.llm.llamacpp_host in ["127.0.0.1", "localhost", "::1"]
+        """
+        Verify configuration is safe for offline operation.
+
+        The invariants are checked once per instance and the result is
+        cached; repeat calls from other components are a flag read. The
+        host checks are not subsumed by field validation, which accepts
+        remote hosts for the opt-in LAN mode.
+        """
+        if self._offline_validated:
+            return True
+        assert self.llm.ollama_host in _ALLOWED_HOSTS
+        assert self.llm.llamacpp_host in _ALLOWED_HOSTS
         assert not self.privacy.enable_telemetry
         assert not self.privacy.enable_analytics
         assert not self.privacy.enable_crash_reports
+        self._offline_validated = True
         return True
 
     def ensure_directories(self) -> None:
-        """Create required directories if they don't exist."""
-        self.output_path.mkdir(parents=True, exist_ok=True)
-        self.cache_path.mkdir(parents=True, exist_ok=True)
-        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        """
+        Create required directories if they don't exist.
+
+        Directories already created this process are remembered, so
+        repeated calls from generators and the watcher skip the mkdir
+        syscalls entirely.
+        """
+        for path in (self.output_path, self.cache_path, self.database_path.parent):
+            if path in _ensured_directories:
+                continue
+            path.mkdir(parents=True, exist_ok=True)
+            _ensured_directories.add(path)
 
     @classmethod
-    def load_from_file(cls, path: Path) -> "Config":
-        """Load configuration from a YAML or JSON file."""
+    def load_from_file_trusted(cls, path: Path) -> "Config":
+        """
+        Load a config previously written by save_to_file, skipping validation.
+
+        model_construct bypasses validator dispatch entirely, so this is
+        markedly faster than load_from_file — but it must only be used
+        on files this tool generated itself, never on hand-edited or
+        third-party configs.
+        """
         import json
 
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        content = path.read_text()
+        data = json.loads(path.read_text())
+
+        # JSON stores paths as strings; restore the typed fields that
+        # are used as Path objects downstream
+        for key in ("codebase_path", "output_path", "cache_path", "database_path"):
+            if key in data:
+                data[key] = Path(data[key])
+        if data.get("llm", {}).get("model_path"):
+            data["llm"]["model_path"] = Path(data["llm"]["model_path"])
+        if "parser" in data and "include_paths" in data["parser"]:
+            data["parser"]["include_paths"] = [
+                Path(p) for p in data["parser"]["include_paths"]
+            ]
+
+        for key, sub_cls in _SUB_MODELS.items():
+            if key in data:
+                data[key] = sub_cls.model_construct(**data[key])
+
+        return cls.model_construct(**data)
+
+    @classmethod
+    def load_from_file(cls, path: Path) -> "Config":
+        """Load configuration from a YAML or JSON file."""
+        if not path.exists():
+            raise FileNotFoundError(f"Config file not found: {path}")
 
         if path.suffix in [".yaml", ".yml"]:
             # We avoid external YAML dependency, use JSON instead
             raise ValueError("YAML not supported. Please use JSON config files.")
 
-        data = json.loads(content)
-        return cls(**data)
+        # Fused parse+validate in pydantic-core, skipping the Python-level
+        # json.loads dict round trip
+        return cls.model_validate_json(path.read_bytes())
 
     def save_to_file(self, path: Path) -> None:
         """Save configuration to a JSON file."""
-        import json
-
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(self.model_dump(mode="json"), f, indent=2, default=str)
+        path.write_text(self.model_dump_json(indent=2))
+
+
+# Sub-model fields of Config, shared by the trusted fast paths below
+_SUB_MODELS: dict[str, type[BaseModel]] = {
+    "llm": LLMConfig,
+    "server": ServerConfig,
+    "privacy": PrivacyConfig,
+    "parser": ParserConfig,
+    "chunker": ChunkerConfig,
+    "documentation": DocumentationConfig,
+}
 
 
 def get_default_config(codebase_path: Path) -> Config:
     """Get a default configuration for the given codebase path."""
-    return Config(codebase_path=codebase_path)
+    # Every value is a trusted hard-coded default, so model_construct
+    # skips validator dispatch; sub-models are constructed the same way
+    # since the default factories would otherwise run full validation
+    return Config.model_construct(
+        codebase_path=codebase_path,
+        **{key: sub_cls.model_construct() for key, sub_cls in _SUB_MODELS.items()},
+    )
@@ -4,13 +4,127 @@ Diagram generator using Graphviz.
 Generates class diagrams with clickable hyperlinks to documentation.
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
+import functools
+import hashlib
+import io
+import os
+import re
 import subprocess
 import shutil
 
 from autodocgen.config import Config
-from autodocgen.parser.models import ClassInfo
+from autodocgen.parser.models import AccessSpecifier, ClassInfo, SymbolKind
+
+
+# Preformatted templates: diagram sources are built by streaming writes
+# into one StringIO instead of appending hundreds of small f-string
+# lines to a list and joining at the end
+_DOT_HEADER = (
+    "digraph ClassDiagram {\n"
+    "    rankdir=TB;\n"
+    '    node [shape=record, style=filled, fillcolor="#E3F2FD", fontname="Helvetica"];\n'
+    '    edge [fontname="Helvetica", fontsize=10];\n'
+    "\n"
+)
+_DOT_NODE_TMPL = '    {id} [label="{label}", href="{href}", target="_top", fillcolor="{color}"];\n'
+_DOT_INHERIT_TMPL = "    {id} -> {base_id} [arrowhead=empty, style=solid];\n"
+_DOT_COMPOSE_TMPL = '    {id} -> {member_id} [arrowhead=diamond, style=dashed, label="{name}"];\n'
+
+_MERMAID_METHOD_TMPL = "        {prefix}{name}({params})\n"
+_MERMAID_INHERIT_TMPL = "    {base_id} <|-- {id}\n"
+_MERMAID_RELATION_TMPL = "    {id} {arrow} {member_id} : {name}\n"
+
+_DEP_HEADER = (
+    "digraph Dependencies {\n"
+    "    rankdir=LR;\n"
+    '    node [shape=box, style=filled, fillcolor="#ECEFF1", fontname="Helvetica"];\n'
+    "\n"
+)
+_DEP_NODE_TMPL = '    {id} [label="{name}"];\n'
+_DEP_EDGE_TMPL = "    {id} -> {dep_id};\n"
+
+
+@functools.cache
+def _graphviz_path() -> Optional[str]:
+    """Resolved path of the dot executable, probed once per process.
+
+    shutil.which walks PATH and stats each entry; generators are
+    instantiated per run (and per pool worker), so share one probe and
+    hand the resolved path to subprocess instead of re-resolving on
+    every exec.
+    """
+    return shutil.which("dot")
+
+
+# Stripping patterns, compiled once: each replaces a chain of
+# str.replace passes (and their intermediate strings) with a single
+# regex substitution.
+_BASE_SPECIFIER_STRIP_RE = re.compile(r"\b(?:public|protected|private|virtual)\s+")
+_QUALIFIER_STRIP_RE = re.compile(r"\b(?:const|volatile)\s+|[&*]")
+_SMART_PTR_RE = re.compile(r"^(?:std::unique_ptr|std::shared_ptr|sp|wp)<")
+
+
+# Pure string normalizers, memoized at module scope: the same node ids,
+# base specifications, and member type spellings recur across every
+# class of a diagram and across diagrams.
+@functools.lru_cache(maxsize=4096)
+def _clean_method_name(name: str) -> str:
+    """Sanitize a method name for Mermaid output."""
+    return name.replace("~", "destroy_").replace("operator=", "operator_assign").replace("operator", "op_")
+
+
+def _short_params(parameters) -> str:
+    """Comma-joined parameter names, elided when too long to render."""
+    params = ", ".join(p.name for p in parameters)
+    return "..." if len(params) > 20 else params
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize_id(name: str) -> str:
+    """Sanitize a name for use as a DOT node ID."""
+    return name.replace("::", "_").replace("<", "_").replace(">", "_").replace(" ", "_")
+
+
+@functools.lru_cache(maxsize=4096)
+def _doc_anchor(qualified_name: str) -> str:
+    """Markdown heading anchor for a qualified name."""
+    return qualified_name.lower().replace("::", "-")
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_base_name(base: str) -> str:
+    """Clean a base class specification."""
+    # Remove access specifiers
+    base = _BASE_SPECIFIER_STRIP_RE.sub("", base)
+
+    # Remove template arguments for matching
+    bracket = base.find("<")
+    if bracket != -1:
+        base = base[:bracket]
+
+    return base.strip()
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_type_name(type_spelling: str) -> str:
+    """Extract the base type name from a type spelling."""
+    # Remove qualifiers
+    type_name = _QUALIFIER_STRIP_RE.sub("", type_spelling)
+
+    # Handle smart pointers - extract inner type
+    wrapper = _SMART_PTR_RE.match(type_name)
+    if wrapper:
+        type_name = type_name[wrapper.end():type_name.rindex(">")]
+
+    # Remove remaining template args
+    bracket = type_name.find("<")
+    if bracket != -1:
+        type_name = type_name[:bracket]
+
+    return type_name.strip()
 
 
 class DiagramGenerator:
@@ -30,10 +144,11 @@ class DiagramGenerator:
         self.config = config
         self.output_format = config.documentation.diagram_format
         self._graphviz_available = self._check_graphviz()
+        self._cache_dir = config.cache_path / "diagram_cache"
 
     def _check_graphviz(self) -> bool:
         """Check if Graphviz is available."""
-        return shutil.which("dot") is not None
+        return _graphviz_path() is not None
 
     def generate_class_diagram(
         self,
@@ -60,99 +175,196 @@ class DiagramGenerator:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate DOT source
+        # Generate DOT source and render it
         dot_source = self._generate_dot(classes, title)
 
-        # Write to temp file and convert
-        dot_path = output_path.with_suffix(".dot")
-        dot_path.write_text(dot_source, encoding="utf-8")
+        return self._render_dot(dot_source, output_path)
+
+    def generate_class_diagrams(
+        self,
+        jobs: list[tuple[list[ClassInfo], Path, Optional[str]]],
+    ) -> dict[Path, bool]:
+        """
+        Generate a batch of class diagrams, fanning out across worker
+        processes.
+
+        Each diagram is independent and both the DOT generation and the
+        dot rendering are CPU-bound, so batches scale with cores. Worker
+        count follows the analyzer's convention: bounded by the batch
+        size, config.parallel_workers, and the machine. Falls back to
+        serial generation for single workers.
+
+        Args:
+            jobs: (classes, output_path, title) per diagram
+
+        Returns:
+            Mapping of output path to whether its diagram was generated
+        """
+        if not jobs:
+            return {}
+
+        max_workers = min(
+            len(jobs), max(1, self.config.parallel_workers), os.cpu_count() or 1
+        )
+
+        if max_workers <= 1:
+            return {
+                output_path: self.generate_class_diagram(classes, output_path, title)
+                for classes, output_path, title in jobs
+            }
+
+        results: dict[Path, bool] = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self.generate_class_diagram, classes, output_path, title): output_path
+                for classes, output_path, title in jobs
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
+
+    def _render_dot(self, dot_source: str, output_path: Path) -> bool:
+        """
+        Render DOT source to a file by piping it to the dot process.
+
+        The source goes over stdin instead of through a temporary .dot
+        file, so each diagram costs one process invocation and no
+        intermediate filesystem round-trips.
+
+        Rendered output is cached under cache_path keyed by a content
+        hash of the DOT source, so incremental runs where the class set
+        is unchanged copy the cached file instead of invoking dot.
+
+        Args:
+            dot_source: DOT graph source
+            output_path: Path to save the rendered diagram
+
+        Returns:
+            True if successful, False otherwise
+        """
+        cache_file = self._render_cache_path(dot_source)
+        if cache_file.exists():
+            try:
+                shutil.copyfile(cache_file, output_path)
+                return True
+            except OSError:
+                pass  # Fall through to a fresh render
 
         try:
             subprocess.run(
-                ["dot", f"-T{self.output_format}", "-o", str(output_path), str(dot_path)],
+                [_graphviz_path() or "dot", f"-T{self.output_format}", "-o", str(output_path)],
+                input=dot_source.encode("utf-8"),
                 check=True,
                 capture_output=True,
             )
-            dot_path.unlink()  # Clean up DOT file
-            return True
         except subprocess.CalledProcessError:
             return False
 
+        # Best effort - a failed cache write never fails the render
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, cache_file)
+        except OSError:
+            pass
+
+        return True
+
+    def _render_cache_path(self, dot_source: str) -> Path:
+        """Cache file path for rendered DOT source, keyed by content."""
+        digest = hashlib.blake2b(
+            dot_source.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return self._cache_dir / f"{digest}.{self.output_format}"
+
     def generate_mermaid(
         self,
         classes: list[ClassInfo],
         title: Optional[str] = None,
     ) -> str:
         """Generate Mermaid class diagram source."""
-        lines = ["classDiagram"]
-        
+        buf = io.StringIO()
+        buf.write("classDiagram\n")
+
         # Track all class names for relationship resolution
         class_names = {cls.qualified_name for cls in classes}
         class_names.update({cls.name for cls in classes})
-        
+
+        # Index for relationship resolution: the per-edge linear scans
+        # matched on simple name or any ::-suffix of the qualified name,
+        # making the relationship pass O(n^2). Registering those same
+        # keys with setdefault in list order keeps the scan's
+        # first-match-wins semantics as a single dict lookup.
+        by_match: dict[str, ClassInfo] = {}
+        for cls in classes:
+            by_match.setdefault(cls.name, cls)
+            qualified = cls.qualified_name
+            sep = qualified.find("::")
+            while sep != -1:
+                by_match.setdefault(qualified[sep + 2:], cls)
+                sep = qualified.find("::", sep + 1)
+
         # Generate classes
         for cls in classes:
             safe_name = self._sanitize_id(cls.qualified_name)
-            
+
             # Add class definition
-            if cls.kind.value == "struct":
-                 lines.append(f"    class {safe_name} {{")
-                 lines.append("        <<struct>>")
-            else:
-                 lines.append(f"    class {safe_name} {{")
-            
+            buf.write(f"    class {safe_name} {{\n")
+            if cls.kind is SymbolKind.STRUCT:
+                buf.write("        <<struct>>\n")
+
             # Add methods (limit 10)
             if cls.public_methods:
-                for method in cls.public_methods[:10]:
-                    prefix = "+" if method.access.value == "public" else "#"
-                    # Sanitize method name
-                    name = method.name.replace("~", "destroy_").replace("operator=", "operator_assign").replace("operator", "op_")
-                    
-                    # Sanitize params (remove types just keep names to keep it short, or simplified)
-                    params = ", ".join(p.name for p in method.parameters)
-                    if len(params) > 20:
-                        params = "..."
-                        
-                    lines.append(f"        {prefix}{name}({params})")
-            
-            lines.append("    }")
-            
+                buf.writelines(
+                    _MERMAID_METHOD_TMPL.format(
+                        prefix="+" if method.access is AccessSpecifier.PUBLIC else "#",
+                        name=_clean_method_name(method.name),
+                        params=_short_params(method.parameters),
+                    )
+                    for method in cls.public_methods[:10]
+                )
+
+            buf.write("    }\n")
+
         # Relationships
         for cls in classes:
             safe_name = self._sanitize_id(cls.qualified_name)
-            
+
             # Inheritance
             for base in cls.base_classes:
                 base_name = self._clean_base_name(base)
                 # Find the matched class in the list to get its fully qualified name
-                matched_base = next((c for c in classes if c.name == base_name or c.qualified_name.endswith("::" + base_name)), None)
-                
+                matched_base = by_match.get(base_name)
+
                 # If found, use its sanitized ID, otherwise check simple name
                 if matched_base:
                     base_id = self._sanitize_id(matched_base.qualified_name)
-                    lines.append(f"    {base_id} <|-- {safe_name}")
+                    buf.write(_MERMAID_INHERIT_TMPL.format(base_id=base_id, id=safe_name))
                 elif base_name in class_names: # Fallback if specific class not found but name exists
                      # This fallback might be risky if names are ambiguous, but better than nothing
                      # However, since we keyed class_names by qualified and simple names, we need to know which one it is.
-                     # If we can't find the object, we can't get the qualified name. 
+                     # If we can't find the object, we can't get the qualified name.
                      # Let's try to assume it matches one of the qualified names if simplest match works
-                     pass 
+                     pass
 
             # Composition/Aggregation
             for member in cls.members:
                 member_type = self._extract_type_name(member.type_spelling)
-                
+
                  # Find the matched class
-                matched_member = next((c for c in classes if c.name == member_type or c.qualified_name.endswith("::" + member_type)), None)
-                
+                matched_member = by_match.get(member_type)
+
                 if matched_member and matched_member.qualified_name != cls.qualified_name:
                     member_id = self._sanitize_id(matched_member.qualified_name)
                     # Check if pointer/reference for aggregation vs composition
                     is_pointer = "*" in member.type_spelling or "ptr" in member.type_spelling
                     arrow = "o--" if is_pointer else "*--"
-                    lines.append(f"    {safe_name} {arrow} {member_id} : {member.name}")
+                    buf.write(_MERMAID_RELATION_TMPL.format(
+                        id=safe_name, arrow=arrow, member_id=member_id, name=member.name
+                    ))
 
-        return "\n".join(lines)
+        # Trailing newline stripped to match the old "\n".join output
+        return buf.getvalue()[:-1]
 
     def _generate_dot(
         self,
@@ -160,18 +372,13 @@ class DiagramGenerator:
         title: Optional[str] = None,
     ) -> str:
         """Generate DOT source for a class diagram."""
-        lines = [
-            "digraph ClassDiagram {",
-            '    rankdir=TB;',
-            '    node [shape=record, style=filled, fillcolor="#E3F2FD", fontname="Helvetica"];',
-            '    edge [fontname="Helvetica", fontsize=10];',
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write(_DOT_HEADER)
 
         if title:
-            lines.append(f'    labelloc="t";')
-            lines.append(f'    label="{title}";')
-            lines.append("")
+            buf.write('    labelloc="t";\n')
+            buf.write(f'    label="{title}";\n')
+            buf.write("\n")
 
         # Track all class names for relationship resolution
         class_names = {cls.qualified_name for cls in classes}
@@ -183,13 +390,12 @@ class DiagramGenerator:
             label = self._generate_class_label(cls)
             href = self._get_doc_link(cls)
 
-            lines.append(
-                f'    {node_id} [label="{label}", '
-                f'href="{href}", target="_top", '
-                f'fillcolor="{self._get_class_color(cls)}"];'
-            )
+            buf.write(_DOT_NODE_TMPL.format(
+                id=node_id, label=label, href=href,
+                color=self._get_class_color(cls),
+            ))
 
-        lines.append("")
+        buf.write("\n")
 
         # Generate relationships
         for cls in classes:
@@ -200,52 +406,51 @@ class DiagramGenerator:
                 base_name = self._clean_base_name(base)
                 if base_name in class_names:
                     base_id = self._sanitize_id(base_name)
-                    lines.append(
-                        f'    {node_id} -> {base_id} '
-                        f'[arrowhead=empty, style=solid];'
-                    )
+                    buf.write(_DOT_INHERIT_TMPL.format(id=node_id, base_id=base_id))
 
             # Composition/Aggregation (from member types)
             for member in cls.members:
                 member_type = self._extract_type_name(member.type_spelling)
                 if member_type in class_names and member_type != cls.name:
                     member_id = self._sanitize_id(member_type)
-                    lines.append(
-                        f'    {node_id} -> {member_id} '
-                        f'[arrowhead=diamond, style=dashed, label="{member.name}"];'
-                    )
+                    buf.write(_DOT_COMPOSE_TMPL.format(
+                        id=node_id, member_id=member_id, name=member.name
+                    ))
 
-        lines.append("}")
+        buf.write("}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _generate_class_label(self, cls: ClassInfo) -> str:
         """Generate a UML-style label for a class."""
+        buf = io.StringIO()
+        buf.write("{")
+
         # Class name section
-        stereotype = ""
-        if cls.kind.value == "struct":
-            stereotype = "«struct»\\n"
+        if cls.kind is SymbolKind.STRUCT:
+            buf.write("«struct»\\n")
         elif cls.template_params:
-            stereotype = "«template»\\n"
-
-        parts = [f"{stereotype}{cls.name}"]
+            buf.write("«template»\\n")
+        buf.write(cls.name)
 
         # Methods section (public only, limit to 5)
-        if cls.public_methods:
-            parts.append("|")
-            for method in cls.public_methods[:5]:
-                prefix = "+" if method.access.value == "public" else "#"
+        public_methods = cls.public_methods
+        if public_methods:
+            buf.write("|")
+            for method in public_methods[:5]:
+                prefix = "+" if method.access is AccessSpecifier.PUBLIC else "#"
                 params = ", ".join(p.name for p in method.parameters)
-                parts.append(f"{prefix}{method.name}({params})\\l")
+                buf.write(f"{prefix}{method.name}({params})\\l")
 
-            if len(cls.public_methods) > 5:
-                parts.append(f"... +{len(cls.public_methods) - 5} more\\l")
+            if len(public_methods) > 5:
+                buf.write(f"... +{len(public_methods) - 5} more\\l")
 
-        return "{" + "".join(parts) + "}"
+        buf.write("}")
+        return buf.getvalue()
 
     def _get_class_color(self, cls: ClassInfo) -> str:
         """Get a color based on class type."""
-        if cls.kind.value == "struct":
+        if cls.kind is SymbolKind.STRUCT:
             return "#E8F5E9"  # Light green
         elif cls.template_params:
             return "#FFF3E0"  # Light orange
@@ -257,47 +462,21 @@ class DiagramGenerator:
         if cls.location:
             # Link to the file's documentation
             relative = cls.location.file_path.name
-            anchor = cls.qualified_name.lower().replace("::", "-")
+            anchor = _doc_anchor(cls.qualified_name)
             return f"../{relative}.md#{anchor}"
         return "#"
 
     def _sanitize_id(self, name: str) -> str:
         """Sanitize a name for use as a DOT node ID."""
-        return name.replace("::", "_").replace("<", "_").replace(">", "_").replace(" ", "_")
+        return _sanitize_id(name)
 
     def _clean_base_name(self, base: str) -> str:
         """Clean a base class specification."""
-        # Remove access specifiers
-        for spec in ["public ", "protected ", "private ", "virtual "]:
-            base = base.replace(spec, "")
-
-        # Remove template arguments for matching
-        if "<" in base:
-            base = base[:base.index("<")]
-
-        return base.strip()
+        return _clean_base_name(base)
 
     def _extract_type_name(self, type_spelling: str) -> str:
         """Extract the base type name from a type spelling."""
-        # Remove qualifiers
-        type_name = type_spelling
-        for remove in ["const ", "volatile ", "&", "*", "&&"]:
-            type_name = type_name.replace(remove, "")
-
-        # Handle smart pointers
-        for wrapper in ["std::unique_ptr", "std::shared_ptr", "sp", "wp"]:
-            if type_name.startswith(wrapper + "<"):
-                # Extract inner type
-                start = type_name.index("<") + 1
-                end = type_name.rindex(">")
-                type_name = type_name[start:end]
-                break
-
-        # Remove remaining template args
-        if "<" in type_name:
-            type_name = type_name[:type_name.index("<")]
-
-        return type_name.strip()
+        return _extract_type_name(type_spelling)
 
     def generate_dependency_diagram(
         self,
@@ -319,34 +498,17 @@ class DiagramGenerator:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        lines = [
-            "digraph Dependencies {",
-            '    rankdir=LR;',
-            '    node [shape=box, style=filled, fillcolor="#ECEFF1", fontname="Helvetica"];',
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write(_DEP_HEADER)
 
         for file_path, deps in file_dependencies.items():
             file_id = self._sanitize_id(file_path.stem)
-            lines.append(f'    {file_id} [label="{file_path.name}"];')
+            buf.write(_DEP_NODE_TMPL.format(id=file_id, name=file_path.name))
 
             for dep in deps:
                 dep_id = self._sanitize_id(dep.stem)
-                lines.append(f'    {file_id} -> {dep_id};')
+                buf.write(_DEP_EDGE_TMPL.format(id=file_id, dep_id=dep_id))
 
-        lines.append("}")
+        buf.write("}")
 
-        dot_source = "\n".join(lines)
-        dot_path = output_path.with_suffix(".dot")
-        dot_path.write_text(dot_source, encoding="utf-8")
-
-        try:
-            subprocess.run(
-                ["dot", f"-T{self.output_format}", "-o", str(output_path), str(dot_path)],
-                check=True,
-                capture_output=True,
-            )
-            dot_path.unlink()
-            return True
-        except subprocess.CalledProcessError:
-            return False
+        return self._render_dot(buf.getvalue(), output_path)
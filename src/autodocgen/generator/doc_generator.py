@@ -2,13 +2,46 @@
 Documentation generator for Markdown output.
 """
 
+import hashlib
+import io
+from collections import defaultdict
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from datetime import datetime
 
 from autodocgen.config import Config
 from autodocgen.parser.models import CppFileAnalysis, ClassInfo, MethodInfo, FunctionInfo
-from autodocgen.generator.diagram_generator import DiagramGenerator
+from autodocgen.generator.diagram_generator import DiagramGenerator, _doc_anchor
+
+
+class _MdWriter:
+    """
+    Line-oriented Markdown writer over a single io.StringIO.
+
+    Documents used to accumulate a list[str] per builder and join at the
+    end; for thousands of files and classes that churns many small
+    strings plus an O(n) join pass. One growable buffer replaces both.
+    """
+
+    __slots__ = ("_buf",)
+
+    def __init__(self) -> None:
+        self._buf = io.StringIO()
+
+    def line(self, text: str) -> None:
+        """Write one line of Markdown."""
+        self._buf.write(text)
+        self._buf.write("\n")
+
+    def blank(self) -> None:
+        """Write an empty line."""
+        self._buf.write("\n")
+
+    def getvalue(self) -> str:
+        """The document so far, without a trailing newline."""
+        # Matches the old "\n".join output: newlines separate lines
+        value = self._buf.getvalue()
+        return value[:-1] if value else value
 
 
 class DocumentationGenerator:
@@ -26,20 +59,35 @@ class DocumentationGenerator:
         self.config = config
         self.output_path = config.output_path
         self.diagram_generator = DiagramGenerator(config)
+        # One timestamp per run: every generated document stamps the same
+        # moment, and the strftime call leaves the per-file hot path
+        self._run_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
 
     def write_file_documentation(
         self,
         file_path: Path,
         analysis: CppFileAnalysis,
-        documentation: str,
+        documentation: "str | Iterable[str]",
+        source_hash: Optional[str] = None,
     ) -> Path:
         """
         Write documentation for a file.
 
+        The header, body, and source stamp are written straight to the
+        open file instead of concatenated into one string first, so the
+        document is never held in memory twice. The body may be an
+        iterable of chunks, letting a streaming LLM response pipe
+        through without materializing.
+
         Args:
             file_path: Original source file path
             analysis: Parsed analysis
-            documentation: LLM-generated documentation
+            documentation: Generated documentation, whole or chunked
+            source_hash: Content hash to stamp into the document. Only
+                LLM-backed callers pass one; the stamp marks the file as
+                up to date for the skip check, so structural fallback
+                docs must stay unstamped or they would never be upgraded
+                once the LLM is reachable again.
 
         Returns:
             Path to the generated documentation file
@@ -49,15 +97,28 @@ class DocumentationGenerator:
         doc_path = self.output_path / relative.with_suffix(".md")
         doc_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate header
-        header = self._generate_header(file_path, analysis)
+        with doc_path.open("w", encoding="utf-8") as f:
+            f.write(self._generate_header(file_path, analysis, relative))
+            f.write("\n\n")
+            if isinstance(documentation, str):
+                f.write(documentation)
+            else:
+                f.writelines(documentation)
 
-        # Write documentation
-        content = f"{header}\n\n{documentation}"
-        doc_path.write_text(content, encoding="utf-8")
+            # Stamp the source hash so unchanged files can skip regeneration
+            if source_hash:
+                f.write(f"\n\n<!-- source_blake2b: {source_hash} -->\n")
 
         return doc_path
 
+    @staticmethod
+    def source_hash(file_path: Path) -> Optional[str]:
+        """Content hash of a source file, or None if it cannot be read."""
+        try:
+            return hashlib.blake2b(file_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
     def read_documentation(self, file_path: Path) -> Optional[str]:
         """
         Read existing documentation for a source file.
@@ -75,55 +136,60 @@ class DocumentationGenerator:
             return doc_path.read_text(encoding="utf-8")
         return None
 
-    def _generate_header(self, file_path: Path, analysis: CppFileAnalysis) -> str:
-        """Generate the documentation header."""
-        relative = file_path.relative_to(self.config.codebase_path)
+    def _generate_header(
+        self,
+        file_path: Path,
+        analysis: CppFileAnalysis,
+        relative: Optional[Path] = None,
+    ) -> str:
+        """Generate the documentation header.
+
+        Callers that already resolved the codebase-relative path pass it
+        in to avoid a second ``relative_to`` walk.
+        """
+        if relative is None:
+            relative = file_path.relative_to(self.config.codebase_path)
 
-        lines = [
-            f"# {file_path.name}",
-            "",
-            "---",
-            "",
-            "| Property | Value |",
-            "|----------|-------|",
-            f"| **Location** | `{relative}` |",
-            f"| **Lines** | {analysis.line_count} |",
-            f"| **Classes** | {len(analysis.all_classes)} |",
-            f"| **Functions** | {len(analysis.all_functions)} |",
-            f"| **Last Updated** | {datetime.now().strftime('%Y-%m-%d %H:%M')} |",
-            "",
-            "---",
-        ]
+        w = _MdWriter()
+        w.line(f"# {file_path.name}")
+        w.blank()
+        w.line("---")
+        w.blank()
+        w.line("| Property | Value |")
+        w.line("|----------|-------|")
+        w.line(f"| **Location** | `{relative}` |")
+        w.line(f"| **Lines** | {analysis.line_count} |")
+        w.line(f"| **Classes** | {len(analysis.all_classes)} |")
+        w.line(f"| **Functions** | {len(analysis.all_functions)} |")
+        w.line(f"| **Last Updated** | {self._run_timestamp} |")
+        w.blank()
+        w.line("---")
 
         # Add navigation
         if analysis.all_classes or analysis.all_functions:
-            lines.extend([
-                "",
-                "## Quick Navigation",
-                "",
-            ])
+            w.blank()
+            w.line("## Quick Navigation")
+            w.blank()
 
             if analysis.all_classes:
-                lines.append("### Classes")
+                w.line("### Classes")
                 for cls in analysis.all_classes:
-                    anchor = cls.qualified_name.lower().replace("::", "-")
-                    lines.append(f"- [{cls.qualified_name}](#{anchor})")
-                lines.append("")
+                    w.line(f"- [{cls.qualified_name}](#{_doc_anchor(cls.qualified_name)})")
+                w.blank()
 
             if analysis.all_functions:
-                lines.append("### Functions")
+                w.line("### Functions")
                 for func in analysis.all_functions[:20]:  # Limit for readability
-                    anchor = func.qualified_name.lower().replace("::", "-")
-                    lines.append(f"- [{func.qualified_name}](#{anchor})")
+                    w.line(f"- [{func.qualified_name}](#{_doc_anchor(func.qualified_name)})")
 
                 if len(analysis.all_functions) > 20:
-                    lines.append(f"- *... and {len(analysis.all_functions) - 20} more*")
+                    w.line(f"- *... and {len(analysis.all_functions) - 20} more*")
 
-                lines.append("")
+                w.blank()
 
-            lines.append("---")
+            w.line("---")
 
-        return "\n".join(lines)
+        return w.getvalue()
 
     def generate_file_documentation(self, analysis: CppFileAnalysis) -> str:
         """
@@ -138,72 +204,66 @@ class DocumentationGenerator:
         Returns:
             Markdown documentation string
         """
-        lines = []
+        w = _MdWriter()
 
         # Overview
         if analysis.namespaces:
             ns_names = [ns.qualified_name for ns in analysis.namespaces]
-            lines.append(f"**Namespaces:** {', '.join(ns_names)}")
-            lines.append("")
+            w.line(f"**Namespaces:** {', '.join(ns_names)}")
+            w.blank()
 
         # Includes
         if analysis.includes:
-            lines.extend([
-                "## Includes",
-                "",
-            ])
+            w.line("## Includes")
+            w.blank()
             for inc in analysis.includes[:10]:
                 icon = "(sys)" if inc.is_system else "(local)"
-                lines.append(f"- {icon} `{inc.path}`")
+                w.line(f"- {icon} `{inc.path}`")
 
             if len(analysis.includes) > 10:
-                lines.append(f"- *... and {len(analysis.includes) - 10} more*")
+                w.line(f"- *... and {len(analysis.includes) - 10} more*")
 
-            lines.append("")
+            w.blank()
 
         # Classes
         for cls in analysis.all_classes:
-            lines.extend(self._document_class_structure(cls))
-            lines.append("")
+            self._document_class_structure(w, cls)
+            w.blank()
 
         # Functions
         if analysis.all_functions:
-            lines.extend([
-                "## Free Functions",
-                "",
-            ])
+            w.line("## Free Functions")
+            w.blank()
             for func in analysis.all_functions:
-                lines.extend(self._document_function_structure(func))
-                lines.append("")
+                self._document_function_structure(w, func)
+                w.blank()
 
-        return "\n".join(lines)
+        return w.getvalue()
 
-    def _document_class_structure(self, cls: ClassInfo) -> list[str]:
-        """Generate structural documentation for a class."""
-        lines = [
-            f"## Class: `{cls.qualified_name}`",
-            "",
-        ]
+    def _document_class_structure(self, w: _MdWriter, cls: ClassInfo) -> None:
+        """Write structural documentation for a class."""
+        w.line(f"## Class: `{cls.qualified_name}`")
+        w.blank()
 
         # Class type
         kind = "struct" if cls.kind.value == "struct" else "class"
-        lines.append(f"**Type:** {kind}")
+        w.line(f"**Type:** {kind}")
 
         # Base classes
         if cls.base_classes:
             bases = ", ".join(f"`{b}`" for b in cls.base_classes)
-            lines.append(f"**Inherits:** {bases}")
+            w.line(f"**Inherits:** {bases}")
 
         # Template
         if cls.template_params:
             params = ", ".join(cls.template_params)
-            lines.append(f"**Template:** `<{params}>`")
+            w.line(f"**Template:** `<{params}>`")
 
         # Location
         if cls.location:
-            lines.append(f"**Lines:** {cls.location.to_range_string()}")
+            w.line(f"**Lines:** {cls.location.to_range_string()}")
 
-        lines.append("")
+        w.blank()
 
         # Methods by access
         for access, methods in [
@@ -212,58 +272,46 @@ class DocumentationGenerator:
             ("Private", cls.private_methods),
         ]:
             if methods:
-                lines.extend([
-                    f"### {access} Methods",
-                    "",
-                ])
+                w.line(f"### {access} Methods")
+                w.blank()
                 for method in methods:
                     sig = f"`{method.signature}`"
                     if method.brief_description:
-                        lines.append(f"- {sig} - {method.brief_description}")
+                        w.line(f"- {sig} - {method.brief_description}")
                     else:
-                        lines.append(f"- {sig}")
-                lines.append("")
+                        w.line(f"- {sig}")
+                w.blank()
 
         # Members
         if cls.members:
-            lines.extend([
-                "### Members",
-                "",
-            ])
+            w.line("### Members")
+            w.blank()
             for member in cls.members:
-                lines.append(f"- `{member.type_spelling} {member.name}`")
-            lines.append("")
-
-        return lines
+                w.line(f"- `{member.type_spelling} {member.name}`")
+            w.blank()
 
-    def _document_function_structure(self, func: FunctionInfo) -> list[str]:
-        """Generate structural documentation for a function."""
-        lines = [
-            f"### `{func.qualified_name}`",
-            "",
-            f"**Signature:** `{func.signature}`",
-            "",
-        ]
+    def _document_function_structure(self, w: _MdWriter, func: FunctionInfo) -> None:
+        """Write structural documentation for a function."""
+        w.line(f"### `{func.qualified_name}`")
+        w.blank()
+        w.line(f"**Signature:** `{func.signature}`")
+        w.blank()
 
         if func.location:
-            lines.append(f"**Lines:** {func.location.to_range_string()}")
-            lines.append("")
+            w.line(f"**Lines:** {func.location.to_range_string()}")
+            w.blank()
 
         if func.brief_description:
-            lines.append(func.brief_description)
-            lines.append("")
+            w.line(func.brief_description)
+            w.blank()
 
         if func.parameters:
-            lines.extend([
-                "**Parameters:**",
-                "",
-            ])
+            w.line("**Parameters:**")
+            w.blank()
             for param in func.parameters:
                 default = f" = {param.default_value}" if param.default_value else ""
-                lines.append(f"- `{param.type_spelling} {param.name}`{default}")
-            lines.append("")
-
-        return lines
+                w.line(f"- `{param.type_spelling} {param.name}`{default}")
+            w.blank()
 
     def generate_diagrams(self, file_path: Path, analysis: CppFileAnalysis) -> None:
         """
@@ -361,57 +409,56 @@ class DocumentationGenerator:
         Returns:
             Path to the generated index file
         """
-        lines = [
-            "# AutoDocGen Documentation",
-            "",
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            "",
-            "---",
-            "",
-            "## Files",
-            "",
-        ]
-
-        # Group by directory
-        by_dir: dict[str, list[tuple[Path, CppFileAnalysis]]] = {}
-
-        for file_path, analysis in analyses.items():
-            relative = file_path.relative_to(self.config.codebase_path)
-            dir_name = str(relative.parent)
-
-            if dir_name not in by_dir:
-                by_dir[dir_name] = []
-            by_dir[dir_name].append((file_path, analysis))
+        w = _MdWriter()
+        w.line("# AutoDocGen Documentation")
+        w.blank()
+        w.line(f"Generated: {self._run_timestamp}")
+        w.blank()
+        w.line("---")
+        w.blank()
+        w.line("## Files")
+        w.blank()
+
+        # Group by directory, resolving each relative path only once.
+        # One presort by (directory, file name) replaces the per-group
+        # sorts: insertion order then already matches the output order.
+        codebase_path = self.config.codebase_path
+        by_dir: defaultdict[str, list[tuple[Path, Path, CppFileAnalysis]]] = defaultdict(list)
+
+        entries = sorted(
+            ((file_path.relative_to(codebase_path), file_path, analysis)
+             for file_path, analysis in analyses.items()),
+            key=lambda e: (str(e[0].parent), e[1].name),
+        )
+        for relative, file_path, analysis in entries:
+            by_dir[str(relative.parent)].append((file_path, relative, analysis))
 
         # Generate tree
-        for dir_name, files in sorted(by_dir.items()):
-            lines.append(f"### Dir: {dir_name}")
-            lines.append("")
+        for dir_name, files in by_dir.items():
+            w.line(f"### Dir: {dir_name}")
+            w.blank()
 
-            for file_path, analysis in sorted(files, key=lambda x: x[0].name):
-                relative = file_path.relative_to(self.config.codebase_path)
+            for file_path, relative, analysis in files:
                 doc_path = relative.with_suffix(".md")
                 class_count = len(analysis.all_classes)
                 func_count = len(analysis.all_functions)
 
-                lines.append(
+                w.line(
                     f"- [{file_path.name}]({doc_path}) "
                     f"({class_count} classes, {func_count} functions)"
                 )
 
-            lines.append("")
+            w.blank()
 
         # Diagrams section
-        lines.extend([
-            "---",
-            "",
-            "## Diagrams",
-            "",
-            "- [Codebase Overview](diagrams/codebase_overview.svg)",
-            "",
-        ])
+        w.line("---")
+        w.blank()
+        w.line("## Diagrams")
+        w.blank()
+        w.line("- [Codebase Overview](diagrams/codebase_overview.svg)")
+        w.blank()
 
         index_path = self.output_path / "index.md"
-        index_path.write_text("\n".join(lines), encoding="utf-8")
+        index_path.write_text(w.getvalue(), encoding="utf-8")
 
         return index_path
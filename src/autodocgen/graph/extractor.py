@@ -7,6 +7,8 @@ and stores them in the DependencyStore.
 Designed for streaming: processes one file at a time to keep memory usage low.
 """
 
+import functools
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -26,6 +28,68 @@ from autodocgen.parser.models import (
 )
 
 
+# Qualifier keywords and reference/pointer decorators stripped in one
+# compiled-regex pass instead of six sequential str.replace scans
+_QUALIFIER_STRIP_RE = re.compile(r"\b(?:const|volatile|mutable)\s+|[&*]")
+
+
+# Primitive types that never become graph nodes
+_PRIMITIVES = frozenset({
+    "void", "int", "char", "bool", "float", "double",
+    "long", "short", "unsigned", "signed", "auto",
+    "size_t", "int8_t", "int16_t", "int32_t", "int64_t",
+    "uint8_t", "uint16_t", "uint32_t", "uint64_t",
+})
+
+
+# Pure type-string parsers, memoized at module scope: a codebase reuses
+# the same few hundred spellings across thousands of members, parameters,
+# and return types, so each distinct spelling is parsed once.
+@functools.lru_cache(maxsize=65536)
+def _normalize_type_name(type_str: str) -> str:
+    """Normalize a type name by removing qualifiers."""
+    # Remove common C++ qualifiers
+    result = _QUALIFIER_STRIP_RE.sub("", type_str)
+
+    # Remove template parameters for base name
+    bracket = result.find("<")
+    if bracket != -1:
+        result = result[:bracket]
+
+    return result.strip()
+
+
+@functools.lru_cache(maxsize=65536)
+def _extract_type_names(type_str: str) -> tuple[str, ...]:
+    """Extract all type names from a type string."""
+    if not type_str:
+        return ()
+
+    base_name = _normalize_type_name(type_str)
+
+    # Handle fully qualified names
+    if "::" in base_name:
+        parts = base_name.split("::")
+        base_name = "::".join(p for p in parts if p)
+
+    if base_name.lower() in _PRIMITIVES or not base_name:
+        return ()
+
+    # Also extract template parameter types
+    result = [base_name]
+
+    if "<" in type_str and ">" in type_str:
+        template_content = type_str[type_str.index("<")+1:type_str.rindex(">")]
+        # Simple split by comma (doesn't handle nested templates perfectly)
+        for part in template_content.split(","):
+            nested = _normalize_type_name(part.strip())
+            if nested and nested.lower() not in _PRIMITIVES:
+                result.append(nested)
+
+    # Tuples are immutable, so the cached value is safe to share
+    return tuple(result)
+
+
 class DependencyExtractor:
     """
     Extracts dependency relationships from parsed C++ files.
@@ -60,305 +124,262 @@ class DependencyExtractor:
         Returns:
             Number of edges extracted
         """
-        if incremental:
-            self.store.delete_file_nodes(file_path)
-        
-        edge_count = 0
-        
+        # Buffer the whole file's nodes and edges, then flush them with
+        # two executemany statements in one transaction: the per-upsert
+        # round trips (and their unused id SELECTs) were the bottleneck
+        # of the graph-write path
+        nodes: list[DependencyNode] = []
+        edges: list[DependencyEdge] = []
+
         # Create file node
-        file_node = DependencyNode(
+        nodes.append(DependencyNode(
             name=file_path.name,
             qualified_name=str(file_path),
             node_type=NodeType.FILE,
             file_path=file_path,
             line_number=1,
-        )
-        self.store.upsert_node(file_node)
-        
+        ))
+
         # Extract include relationships
-        edge_count += self._extract_includes(file_path, analysis)
-        
+        self._extract_includes(file_path, analysis, edges)
+
         # Extract class relationships
         for cls in analysis.all_classes:
-            edge_count += self._extract_class(file_path, cls)
-        
+            self._extract_class(file_path, cls, nodes, edges)
+
         # Extract function relationships
         for func in analysis.all_functions:
-            edge_count += self._extract_function(file_path, func)
-        
+            self._extract_function(file_path, func, nodes, edges)
+
         # Extract namespace containment
         for ns in analysis.namespaces:
-            edge_count += self._extract_namespace(file_path, ns)
-        
-        return edge_count
+            self._extract_namespace(file_path, ns, nodes, edges)
 
-    def _extract_includes(self, file_path: Path, analysis: CppFileAnalysis) -> int:
+        # A class often references the same type from several members and
+        # methods; the upsert keeps only the last row per edge key anyway,
+        # so drop the redundant writes before flushing
+        deduped = list({
+            (e.source_qualified_name, e.target_qualified_name, e.edge_type): e
+            for e in edges
+        }.values())
+
+        with self.store.batch():
+            if incremental:
+                self.store.delete_file_nodes(file_path)
+            self.store.upsert_nodes_many(nodes)
+            self.store.upsert_edges_many(deduped)
+
+        return len(deduped)
+
+    def _extract_includes(
+        self,
+        file_path: Path,
+        analysis: CppFileAnalysis,
+        edges: list[DependencyEdge],
+    ) -> None:
         """Extract include dependencies."""
-        edge_count = 0
-        
         for include in analysis.includes:
             if include.is_system:
                 continue  # Skip system includes
-            
+
             # Create edge: this file includes another
-            edge = DependencyEdge(
+            edges.append(DependencyEdge(
                 source_qualified_name=str(file_path),
                 target_qualified_name=include.path,
                 edge_type=EdgeType.INCLUDES,
                 context=f"Line {include.line}" if include.line else None,
-            )
-            self.store.upsert_edge(edge)
-            edge_count += 1
-        
-        return edge_count
+            ))
 
-    def _extract_class(self, file_path: Path, cls: ClassInfo) -> int:
+    def _extract_class(
+        self,
+        file_path: Path,
+        cls: ClassInfo,
+        nodes: list[DependencyNode],
+        edges: list[DependencyEdge],
+    ) -> None:
         """Extract class dependencies."""
-        edge_count = 0
-        
         # Create class node
-        class_node = DependencyNode(
+        nodes.append(DependencyNode(
             name=cls.name,
             qualified_name=cls.qualified_name,
             node_type=NodeType.CLASS if cls.kind == SymbolKind.CLASS else NodeType.STRUCT,
             file_path=file_path,
             line_number=cls.location.line_start if cls.location else None,
-        )
-        self.store.upsert_node(class_node)
-        
+        ))
+
         # File contains class
-        edge = DependencyEdge(
+        edges.append(DependencyEdge(
             source_qualified_name=str(file_path),
             target_qualified_name=cls.qualified_name,
             edge_type=EdgeType.CONTAINS,
-        )
-        self.store.upsert_edge(edge)
-        edge_count += 1
-        
+        ))
+
         # Inheritance relationships
         for base in cls.base_classes:
             base_name = self._normalize_type_name(base)
-            edge = DependencyEdge(
+            edges.append(DependencyEdge(
                 source_qualified_name=cls.qualified_name,
                 target_qualified_name=base_name,
                 edge_type=EdgeType.INHERITS,
                 context=f"extends {base}",
-            )
-            self.store.upsert_edge(edge)
-            edge_count += 1
-        
+            ))
+
         # Member type dependencies
         for member in cls.members:
             type_names = self._extract_type_names(member.type_spelling)
             for type_name in type_names:
                 if type_name and type_name != cls.qualified_name:
-                    edge = DependencyEdge(
+                    edges.append(DependencyEdge(
                         source_qualified_name=cls.qualified_name,
                         target_qualified_name=type_name,
                         edge_type=EdgeType.USES,
                         context=f"member: {member.name}",
-                    )
-                    self.store.upsert_edge(edge)
-                    edge_count += 1
-        
+                    ))
+
         # Method parameter/return type dependencies
         for method in cls.methods:
-            edge_count += self._extract_method_dependencies(
-                cls.qualified_name, method
-            )
-        
-        return edge_count
+            self._extract_method_dependencies(cls.qualified_name, method, edges)
 
-    def _extract_function(self, file_path: Path, func: FunctionInfo) -> int:
+    def _extract_function(
+        self,
+        file_path: Path,
+        func: FunctionInfo,
+        nodes: list[DependencyNode],
+        edges: list[DependencyEdge],
+    ) -> None:
         """Extract free function dependencies."""
-        edge_count = 0
-        
         # Create function node
-        func_node = DependencyNode(
+        nodes.append(DependencyNode(
             name=func.name,
             qualified_name=func.qualified_name,
             node_type=NodeType.FUNCTION,
             file_path=file_path,
             line_number=func.location.line_start if func.location else None,
-        )
-        self.store.upsert_node(func_node)
-        
+        ))
+
         # File contains function
-        edge = DependencyEdge(
+        edges.append(DependencyEdge(
             source_qualified_name=str(file_path),
             target_qualified_name=func.qualified_name,
             edge_type=EdgeType.CONTAINS,
-        )
-        self.store.upsert_edge(edge)
-        edge_count += 1
-        
+        ))
+
         # Return type dependency
         type_names = self._extract_type_names(func.return_type)
         for type_name in type_names:
             if type_name:
-                edge = DependencyEdge(
+                edges.append(DependencyEdge(
                     source_qualified_name=func.qualified_name,
                     target_qualified_name=type_name,
                     edge_type=EdgeType.USES,
                     context="return type",
-                )
-                self.store.upsert_edge(edge)
-                edge_count += 1
-        
+                ))
+
         # Parameter type dependencies
         for param in func.parameters:
             type_names = self._extract_type_names(param.type_spelling)
             for type_name in type_names:
                 if type_name:
-                    edge = DependencyEdge(
+                    edges.append(DependencyEdge(
                         source_qualified_name=func.qualified_name,
                         target_qualified_name=type_name,
                         edge_type=EdgeType.USES,
                         context=f"param: {param.name}",
-                    )
-                    self.store.upsert_edge(edge)
-                    edge_count += 1
-        
-        return edge_count
+                    ))
 
     def _extract_method_dependencies(
-        self, 
-        class_name: str, 
-        method: FunctionInfo
-    ) -> int:
+        self,
+        class_name: str,
+        method: FunctionInfo,
+        edges: list[DependencyEdge],
+    ) -> None:
         """Extract dependencies from a method."""
-        edge_count = 0
-        
         # Return type
         type_names = self._extract_type_names(method.return_type)
         for type_name in type_names:
             if type_name and type_name != class_name:
-                edge = DependencyEdge(
+                edges.append(DependencyEdge(
                     source_qualified_name=class_name,
                     target_qualified_name=type_name,
                     edge_type=EdgeType.USES,
                     context=f"method {method.name} returns",
-                )
-                self.store.upsert_edge(edge)
-                edge_count += 1
-        
+                ))
+
         # Parameters
         for param in method.parameters:
             type_names = self._extract_type_names(param.type_spelling)
             for type_name in type_names:
                 if type_name and type_name != class_name:
-                    edge = DependencyEdge(
+                    edges.append(DependencyEdge(
                         source_qualified_name=class_name,
                         target_qualified_name=type_name,
                         edge_type=EdgeType.USES,
                         context=f"method {method.name} param",
-                    )
-                    self.store.upsert_edge(edge)
-                    edge_count += 1
-        
-        return edge_count
+                    ))
 
-    def _extract_namespace(self, file_path: Path, ns: NamespaceInfo) -> int:
-        """Extract namespace containment."""
-        edge_count = 0
-        
-        # Create namespace node
-        ns_node = DependencyNode(
-            name=ns.name,
-            qualified_name=ns.qualified_name,
-            node_type=NodeType.NAMESPACE,
-            file_path=file_path,
-            line_number=ns.location.line_start if ns.location else None,
-        )
-        self.store.upsert_node(ns_node)
-        
-        # File contains namespace
-        edge = DependencyEdge(
-            source_qualified_name=str(file_path),
-            target_qualified_name=ns.qualified_name,
-            edge_type=EdgeType.CONTAINS,
-        )
-        self.store.upsert_edge(edge)
-        edge_count += 1
-        
-        # Namespace contains classes
-        for cls in ns.classes:
-            edge = DependencyEdge(
-                source_qualified_name=ns.qualified_name,
-                target_qualified_name=cls.qualified_name,
-                edge_type=EdgeType.CONTAINS,
-            )
-            self.store.upsert_edge(edge)
-            edge_count += 1
-        
-        # Namespace contains functions
-        for func in ns.functions:
-            edge = DependencyEdge(
-                source_qualified_name=ns.qualified_name,
-                target_qualified_name=func.qualified_name,
-                edge_type=EdgeType.CONTAINS,
-            )
-            self.store.upsert_edge(edge)
-            edge_count += 1
-        
-        # Nested namespaces
-        for nested in ns.nested_namespaces:
-            edge_count += self._extract_namespace(file_path, nested)
-            edge = DependencyEdge(
-                source_qualified_name=ns.qualified_name,
-                target_qualified_name=nested.qualified_name,
+    def _extract_namespace(
+        self,
+        file_path: Path,
+        ns: NamespaceInfo,
+        nodes: list[DependencyNode],
+        edges: list[DependencyEdge],
+    ) -> None:
+        """Extract namespace containment.
+
+        Walks the namespace tree with an explicit stack rather than
+        recursion, so deeply nested hierarchies cannot hit the
+        interpreter's recursion limit. Traversal order differs from the
+        recursive version, but the upserted rows are order-independent.
+        """
+        stack = [ns]
+        while stack:
+            current = stack.pop()
+
+            # Create namespace node
+            nodes.append(DependencyNode(
+                name=current.name,
+                qualified_name=current.qualified_name,
+                node_type=NodeType.NAMESPACE,
+                file_path=file_path,
+                line_number=current.location.line_start if current.location else None,
+            ))
+
+            # File contains namespace
+            edges.append(DependencyEdge(
+                source_qualified_name=str(file_path),
+                target_qualified_name=current.qualified_name,
                 edge_type=EdgeType.CONTAINS,
-            )
-            self.store.upsert_edge(edge)
-            edge_count += 1
-        
-        return edge_count
+            ))
+
+            # Namespace contains classes
+            for cls in current.classes:
+                edges.append(DependencyEdge(
+                    source_qualified_name=current.qualified_name,
+                    target_qualified_name=cls.qualified_name,
+                    edge_type=EdgeType.CONTAINS,
+                ))
+
+            # Namespace contains functions
+            for func in current.functions:
+                edges.append(DependencyEdge(
+                    source_qualified_name=current.qualified_name,
+                    target_qualified_name=func.qualified_name,
+                    edge_type=EdgeType.CONTAINS,
+                ))
+
+            # Nested namespaces
+            for nested in current.nested_namespaces:
+                edges.append(DependencyEdge(
+                    source_qualified_name=current.qualified_name,
+                    target_qualified_name=nested.qualified_name,
+                    edge_type=EdgeType.CONTAINS,
+                ))
+                stack.append(nested)
 
     def _normalize_type_name(self, type_str: str) -> str:
         """Normalize a type name by removing qualifiers."""
-        # Remove common C++ qualifiers
-        result = type_str
-        for remove in ["const ", "volatile ", "mutable ", "&", "*", "&&"]:
-            result = result.replace(remove, "")
-        
-        # Remove template parameters for base name
-        if "<" in result:
-            result = result[:result.index("<")]
-        
-        return result.strip()
+        return _normalize_type_name(type_str)
 
-    def _extract_type_names(self, type_str: str) -> list[str]:
+    def _extract_type_names(self, type_str: str) -> tuple[str, ...]:
         """Extract all type names from a type string."""
-        if not type_str:
-            return []
-        
-        # Skip primitive types
-        primitives = {
-            "void", "int", "char", "bool", "float", "double", 
-            "long", "short", "unsigned", "signed", "auto",
-            "size_t", "int8_t", "int16_t", "int32_t", "int64_t",
-            "uint8_t", "uint16_t", "uint32_t", "uint64_t",
-        }
-        
-        base_name = self._normalize_type_name(type_str)
-        
-        # Handle fully qualified names
-        if "::" in base_name:
-            parts = base_name.split("::")
-            base_name = "::".join(p for p in parts if p)
-        
-        if base_name.lower() in primitives or not base_name:
-            return []
-        
-        # Also extract template parameter types
-        result = [base_name]
-        
-        if "<" in type_str and ">" in type_str:
-            template_content = type_str[type_str.index("<")+1:type_str.rindex(">")]
-            # Simple split by comma (doesn't handle nested templates perfectly)
-            for part in template_content.split(","):
-                nested = self._normalize_type_name(part.strip())
-                if nested and nested.lower() not in primitives:
-                    result.append(nested)
-        
-        return result
+        return _extract_type_names(type_str)
@@ -32,23 +32,67 @@ class DependencyStore:
     def __init__(self, db_path: Path):
         """
         Initialize the dependency store.
-        
+
         Args:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+
+        # One persistent connection; opening and fsync-closing a fresh
+        # connection per upsert dominated the graph-write path.
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # WAL with relaxed sync: the graph is rebuildable from source, so
+        # durability per statement is not worth an fsync per statement.
+        self._conn.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-65536;"
+        )
+        self._in_batch = False
+
         self._ensure_tables()
 
     @contextmanager
     def _get_connection(self):
-        """Get a database connection with proper cleanup."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """Yield the persistent connection, committing outside batches.
+
+        A failure outside a batch rolls back immediately; otherwise the
+        open transaction would linger on the persistent connection and
+        its partial writes would ride along with the next successful
+        commit.
+        """
         try:
-            yield conn
-            conn.commit()
+            yield self._conn
+        except Exception:
+            if not self._in_batch:
+                self._conn.rollback()
+            raise
+        if not self._in_batch:
+            self._conn.commit()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group many upserts into a single transaction.
+
+        Wrapping a file's worth of node/edge writes in one batch turns
+        hundreds of autocommits into one commit per file.
+        """
+        self._in_batch = True
+        try:
+            yield
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
         finally:
-            conn.close()
+            self._in_batch = False
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
 
     def _ensure_tables(self) -> None:
         """Create tables and indexes if they don't exist."""
@@ -134,6 +178,58 @@ class DependencyStore:
             )
             return cursor.fetchone()[0]
 
+    def upsert_nodes_many(self, nodes: list[DependencyNode]) -> None:
+        """
+        Upsert a batch of nodes with one executemany statement.
+
+        Unlike upsert_node, no ids are fetched back - callers batching
+        writes do not use them, and skipping the per-row SELECT halves
+        the statement count.
+        """
+        if not nodes:
+            return
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO dependency_nodes
+                    (name, qualified_name, node_type, file_path, line_number)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(qualified_name) DO UPDATE SET
+                    name = excluded.name,
+                    node_type = excluded.node_type,
+                    file_path = excluded.file_path,
+                    line_number = excluded.line_number
+            """, [
+                (
+                    node.name,
+                    node.qualified_name,
+                    node.node_type.value,
+                    str(node.file_path) if node.file_path else None,
+                    node.line_number,
+                )
+                for node in nodes
+            ])
+
+    def upsert_edges_many(self, edges: list[DependencyEdge]) -> None:
+        """Upsert a batch of edges with one executemany statement."""
+        if not edges:
+            return
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO dependency_edges
+                    (source_qualified_name, target_qualified_name, edge_type, context)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(source_qualified_name, target_qualified_name, edge_type)
+                DO UPDATE SET context = excluded.context
+            """, [
+                (
+                    edge.source_qualified_name,
+                    edge.target_qualified_name,
+                    edge.edge_type.value,
+                    edge.context,
+                )
+                for edge in edges
+            ])
+
     def upsert_edge(self, edge: DependencyEdge) -> int:
         """
         Insert or update an edge.
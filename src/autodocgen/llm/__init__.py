@@ -4,8 +4,10 @@ LLM integration module for local inference.
 
 from autodocgen.llm.ollama_client import OllamaClient
 from autodocgen.llm.prompts import PromptBuilder
+from autodocgen.llm.semantic_cache import SemanticCache
 
 __all__ = [
     "OllamaClient",
     "PromptBuilder",
+    "SemanticCache",
 ]
@@ -4,9 +4,11 @@ Ollama client for local LLM inference.
 All communication is restricted to localhost for privacy.
 """
 
+import asyncio
 import json
 import sqlite3
 import hashlib
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Iterator
@@ -14,6 +16,7 @@ from urllib.request import urlopen, Request
 from urllib.error import URLError
 
 from autodocgen.config import Config
+from autodocgen.llm.semantic_cache import SemanticCache
 
 
 @dataclass
@@ -45,18 +48,27 @@ class OllamaClient:
         self.base_url = config.llm.get_base_url()
         self.model = config.llm.model_name
 
-        # Response cache
+        # Response cache (shared across batch worker threads)
         self._cache_enabled = config.privacy.cache_llm_responses
         self._cache_db: Optional[sqlite3.Connection] = None
+        self._cache_lock = threading.Lock()
+
+        # Bounds in-flight requests for async callers (see agenerate)
+        self._async_limit = asyncio.Semaphore(max(1, config.llm.concurrency))
         if self._cache_enabled:
             self._init_cache()
 
+        # Optional similarity cache for near-duplicate prompts
+        self._semantic_cache: Optional[SemanticCache] = None
+        if self._cache_enabled and config.llm.semantic_cache:
+            self._semantic_cache = SemanticCache(config, embedder=self.embed_batch)
+
     def _init_cache(self) -> None:
         """Initialize the response cache database."""
         cache_path = self.config.cache_path / "llm_cache.db"
         cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._cache_db = sqlite3.connect(str(cache_path))
+        self._cache_db = sqlite3.connect(str(cache_path), check_same_thread=False)
         self._cache_db.execute("""
             CREATE TABLE IF NOT EXISTS response_cache (
                 prompt_hash TEXT PRIMARY KEY,
@@ -120,15 +132,29 @@ class OllamaClient:
             if cached:
                 return cached
 
+        # Fall back to a near-duplicate prompt's response if enabled
+        if use_cache and self._semantic_cache:
+            similar = self._semantic_cache.lookup((system_prompt or "") + prompt)
+            if similar is not None:
+                return LLMResponse(
+                    content=similar,
+                    model=self.model,
+                    tokens_used=0,
+                    cached=True,
+                )
+
         # Build request payload - use effective values for low resource mode
         payload = {
             "model": self.model,
             "prompt": prompt,
             "stream": False,
+            # Keep the model (and its KV cache for the shared system
+            # prompt prefix) resident between chunk requests
+            "keep_alive": "30m",
             "options": {
                 "temperature": self.config.llm.temperature,
                 "num_predict": self.config.llm.get_effective_max_tokens(),
-                "num_ctx": self.config.llm.get_effective_context(),
+                "num_ctx": self._size_num_ctx(prompt, system_prompt),
                 "num_gpu": self.config.llm.gpu_layers,  # 0 = CPU only (fixes CUDA errors)
             },
         }
@@ -157,6 +183,10 @@ class OllamaClient:
                 # Cache the response
                 if use_cache and self._cache_enabled:
                     self._cache_response(prompt, system_prompt, result)
+                if use_cache and self._semantic_cache:
+                    self._semantic_cache.add(
+                        (system_prompt or "") + prompt, result.content
+                    )
 
                 return result
 
@@ -182,6 +212,102 @@ class OllamaClient:
                 error="Request timed out",
             )
 
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> LLMResponse:
+        """
+        Async counterpart of generate for coroutine-based callers.
+
+        The client is stdlib-urllib based, so the request runs on a worker
+        thread; awaiting several agenerate calls under asyncio.gather
+        overlaps their round-trips just like the thread-pool batch path.
+        Concurrency is bounded by config.llm.concurrency so a large gather
+        cannot flood the Ollama server.
+
+        Args:
+            prompt: The prompt to send
+            system_prompt: Optional system prompt
+            use_cache: Whether to use cached responses
+
+        Returns:
+            LLMResponse with the generated content
+        """
+        async with self._async_limit:
+            return await asyncio.to_thread(
+                self.generate, prompt, system_prompt, use_cache
+            )
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed multiple texts in one /api/embed roundtrip.
+
+        Ollama's batch endpoint accepts a list input, so all chunks of a
+        file embed in a single HTTP call instead of one call per chunk.
+        Older Ollama servers lack the batch endpoint; those fall back to
+        one legacy /api/embeddings request per text.
+
+        Args:
+            texts: The texts to embed
+
+        Returns:
+            One embedding per input text, or an empty list on failure
+        """
+        if not texts:
+            return []
+
+        payload = {
+            "model": self.config.llm.embed_model,
+            "input": texts,
+        }
+
+        try:
+            req = Request(
+                f"{self.base_url}/api/embed",
+                data=json.dumps(payload).encode(),
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            with urlopen(req, timeout=120) as response:
+                data = json.loads(response.read().decode())
+
+            embeddings = data.get("embeddings")
+            if embeddings and len(embeddings) == len(texts):
+                return embeddings
+
+            # Legacy servers respond without embeddings[]; embed one at a time
+            return self._embed_sequential(texts)
+
+        except (URLError, TimeoutError, json.JSONDecodeError):
+            return []
+
+    def _embed_sequential(self, texts: list[str]) -> list[list[float]]:
+        """Fallback for pre-batch Ollama: one /api/embeddings call per text."""
+        embeddings = []
+        for text in texts:
+            payload = {
+                "model": self.config.llm.embed_model,
+                "prompt": text,
+            }
+            try:
+                req = Request(
+                    f"{self.base_url}/api/embeddings",
+                    data=json.dumps(payload).encode(),
+                    headers={"Content-Type": "application/json"},
+                    method="POST",
+                )
+                with urlopen(req, timeout=60) as response:
+                    data = json.loads(response.read().decode())
+                embedding = data.get("embedding")
+                if not embedding:
+                    return []
+                embeddings.append(embedding)
+            except (URLError, TimeoutError, json.JSONDecodeError):
+                return []
+        return embeddings
+
     def generate_streaming(
         self,
         prompt: str,
@@ -201,10 +327,11 @@ class OllamaClient:
             "model": self.model,
             "prompt": prompt,
             "stream": True,
+            "keep_alive": "30m",
             "options": {
                 "temperature": self.config.llm.temperature,
                 "num_predict": self.config.llm.get_effective_max_tokens(),
-                "num_ctx": self.config.llm.get_effective_context(),
+                "num_ctx": self._size_num_ctx(prompt, system_prompt),
             },
         }
 
@@ -235,10 +362,40 @@ class OllamaClient:
         except (URLError, TimeoutError) as e:
             yield f"\n\n[Error: {e}]"
 
+    def _size_num_ctx(self, prompt: str, system_prompt: Optional[str]) -> int:
+        """
+        Size the KV cache to the actual request instead of the full window.
+
+        Ollama allocates num_ctx worth of KV cache per request; reserving
+        the whole configured window for a short chunk prompt wastes memory
+        and limits how many requests can run in parallel.
+        """
+        # Rough heuristic: ~3 bytes of prompt text per token, plus the
+        # generation budget and some headroom.
+        prompt_tokens = (len(prompt) + len(system_prompt or "")) // 3
+        needed = prompt_tokens + self.config.llm.get_effective_max_tokens() + 512
+
+        # Round up to the next power of two, clamped to the configured window
+        ctx = 1 << (needed - 1).bit_length()
+        return min(ctx, self.config.llm.get_effective_context())
+
     def _get_cache_key(self, prompt: str, system_prompt: Optional[str]) -> str:
-        """Generate a cache key for a prompt."""
-        content = f"{self.model}:{system_prompt or ''}:{prompt}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        """
+        Generate a content-addressed cache key for a prompt.
+
+        Generation parameters are part of the key so responses produced
+        with different sampling settings never alias each other.
+        """
+        params = json.dumps(
+            {
+                "temperature": self.config.llm.temperature,
+                "num_predict": self.config.llm.get_effective_max_tokens(),
+                "num_ctx": self.config.llm.get_effective_context(),
+            },
+            sort_keys=True,
+        )
+        content = "\x00".join((self.model, params, system_prompt or "", prompt))
+        return hashlib.blake2b(content.encode()).hexdigest()
 
     def _get_cached(
         self, prompt: str, system_prompt: Optional[str]
@@ -248,11 +405,12 @@ class OllamaClient:
             return None
 
         cache_key = self._get_cache_key(prompt, system_prompt)
-        cursor = self._cache_db.execute(
-            "SELECT response, model, tokens_used FROM response_cache WHERE prompt_hash = ?",
-            (cache_key,),
-        )
-        row = cursor.fetchone()
+        with self._cache_lock:
+            cursor = self._cache_db.execute(
+                "SELECT response, model, tokens_used FROM response_cache WHERE prompt_hash = ?",
+                (cache_key,),
+            )
+            row = cursor.fetchone()
 
         if row:
             return LLMResponse(
@@ -275,15 +433,16 @@ class OllamaClient:
             return
 
         cache_key = self._get_cache_key(prompt, system_prompt)
-        self._cache_db.execute(
-            """
-            INSERT OR REPLACE INTO response_cache
-            (prompt_hash, model, response, tokens_used)
-            VALUES (?, ?, ?, ?)
-            """,
-            (cache_key, response.model, response.content, response.tokens_used),
-        )
-        self._cache_db.commit()
+        with self._cache_lock:
+            self._cache_db.execute(
+                """
+                INSERT OR REPLACE INTO response_cache
+                (prompt_hash, model, response, tokens_used)
+                VALUES (?, ?, ?, ?)
+                """,
+                (cache_key, response.model, response.content, response.tokens_used),
+            )
+            self._cache_db.commit()
 
     def clear_cache(self) -> None:
         """Clear the response cache."""
@@ -293,6 +452,8 @@ class OllamaClient:
 
     def close(self) -> None:
         """Close database connections."""
+        if self._semantic_cache:
+            self._semantic_cache.save()
         if self._cache_db:
             self._cache_db.close()
             self._cache_db = None
@@ -105,18 +105,36 @@ class PromptBuilder:
 
         Returns:
             The formatted prompt string
+
+        The prompt is laid out stable-prefix-first: the fixed request
+        header, the per-type requirements, and the file path precede all
+        per-chunk material (line range, dependencies, code). Every chunk
+        of a file therefore shares the longest possible common prefix
+        with its siblings, which Ollama's prefix KV-cache can reuse
+        instead of re-encoding per call.
         """
+        # Stable prefix: identical for every chunk of the same type
         prompt_parts = [
             "# Documentation Generation Request",
             "",
             "Generate COMPREHENSIVE documentation for the following C++ code.",
             "**DO NOT generate brief summaries. Provide DETAILED, COMPLETE documentation.**",
             "",
+        ]
+        prompt_parts.extend(self._get_documentation_requirements(chunk))
+
+        # Stable per-file header
+        prompt_parts.extend([
+            "",
             "## File Context",
             f"- **File:** `{chunk.file_path}`",
+        ])
+
+        # Per-chunk dynamic tail
+        prompt_parts.extend([
             f"- **Lines:** {chunk.line_start} - {chunk.line_end}",
             f"- **Chunk:** {chunk.chunk_index + 1} of {chunk.total_chunks}",
-        ]
+        ])
 
         if chunk.context.namespace:
             prompt_parts.append(f"- **Namespace:** `{chunk.context.namespace}`")
@@ -154,12 +172,8 @@ class PromptBuilder:
             "```cpp",
             chunk.code,
             "```",
-            "",
         ])
 
-        # Documentation requirements
-        prompt_parts.extend(self._get_documentation_requirements(chunk))
-
         return "\n".join(prompt_parts)
 
     def build_class_prompt(
@@ -0,0 +1,157 @@
+"""
+Semantic response cache backed by Ollama embeddings.
+
+Beyond the exact-hash response cache, many chunks across files produce
+near-identical prompts (same system prompt, similar small classes). This
+cache embeds each prompt and reuses the response of a previously seen
+prompt when cosine similarity exceeds a configurable threshold.
+
+All embedding requests go to the same local Ollama server as generation;
+nothing leaves the machine. The cache disables itself cleanly when the
+embedding model or server is unavailable.
+"""
+
+import json
+import math
+import threading
+from typing import Callable, Optional
+
+from autodocgen.config import Config
+
+
+class SemanticCache:
+    """
+    Similarity-based prompt/response cache.
+
+    Entries are held in memory as (unit-normalized embedding, response)
+    pairs and persisted as a JSON sidecar in the cache directory. The
+    corpus is small (one entry per unique generated chunk), so a linear
+    dot-product scan is fast enough without an ANN index dependency.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        embedder: Callable[[list[str]], list[list[float]]],
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            config: AutoDocGen configuration
+            embedder: Batch embedding function, e.g. OllamaClient.embed_batch
+        """
+        self.config = config
+        self.threshold = config.llm.semantic_cache_threshold
+        self._embedder = embedder
+
+        self._entries: list[tuple[list[float], str]] = []
+        self._lock = threading.Lock()
+        self._dirty = False
+        # Set on the first failed embed call so one missing model does not
+        # pay a round-trip per prompt
+        self._disabled = False
+
+        self._path = config.cache_path / "semantic_cache.json"
+        self._load()
+
+    def lookup(self, prompt: str) -> Optional[str]:
+        """
+        Look up a cached response for a semantically similar prompt.
+
+        Args:
+            prompt: The prompt about to be sent to the LLM
+
+        Returns:
+            The cached response text, or None on miss
+        """
+        if self._disabled:
+            return None
+
+        embedding = self._embed(prompt)
+        if embedding is None:
+            return None
+
+        with self._lock:
+            best_score = self.threshold
+            best_response: Optional[str] = None
+            for cached_embedding, response in self._entries:
+                score = _dot(embedding, cached_embedding)
+                if score >= best_score:
+                    best_score = score
+                    best_response = response
+            return best_response
+
+    def add(self, prompt: str, response: str) -> None:
+        """
+        Record a freshly generated response for future similarity hits.
+
+        Args:
+            prompt: The prompt that was sent
+            response: The generated response text
+        """
+        if self._disabled or not response:
+            return
+
+        embedding = self._embed(prompt)
+        if embedding is None:
+            return
+
+        with self._lock:
+            self._entries.append((embedding, response))
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache to disk (best effort)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                payload = [
+                    {"embedding": emb, "response": resp}
+                    for emb, resp in self._entries
+                ]
+                self._path.write_text(json.dumps(payload), encoding="utf-8")
+                self._dirty = False
+            except OSError:
+                pass
+
+    def _load(self) -> None:
+        """Load persisted entries, ignoring corrupt or missing files."""
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+            self._entries = [
+                (entry["embedding"], entry["response"])
+                for entry in payload
+            ]
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            self._entries = []
+
+    def _embed(self, text: str) -> Optional[list[float]]:
+        """
+        Embed a prompt via the batch embedder, unit-normalized.
+
+        Returns:
+            The normalized embedding, or None if embedding failed
+        """
+        embeddings = self._embedder([text])
+        if not embeddings:
+            self._disabled = True
+            return None
+        return _normalize(embeddings[0])
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    """Scale a vector to unit length so dot product equals cosine."""
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0.0:
+        return vector
+    return [v / norm for v in vector]
+
+
+def _dot(a: list[float], b: list[float]) -> float:
+    """Dot product of two equal-length vectors."""
+    if len(a) != len(b):
+        return 0.0
+    return sum(x * y for x, y in zip(a, b))
@@ -93,6 +93,11 @@ def init(
         "--auto-retry/--no-auto-retry",
         help="Automatically retry failed documentation files",
     ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse cached LLM responses for unchanged prompts",
+    ),
 ):
     """
     Initialize documentation generation for a C++ codebase.
@@ -118,6 +123,7 @@ def init(
     config.output_path = output
     config.llm.model_name = model
     config.llm.low_resource_mode = low_resource
+    config.privacy.cache_llm_responses = use_cache
 
     # Validate offline mode
     config.validate_offline_mode()
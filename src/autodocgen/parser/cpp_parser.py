@@ -6,6 +6,7 @@ including classes, methods, functions, templates, and their relationships.
 """
 
 import hashlib
+import pickle
 from pathlib import Path
 from typing import Optional
 
@@ -39,6 +40,10 @@ from autodocgen.parser.models import (
 )
 
 
+# Bump to invalidate cached parse results when extraction logic changes
+PARSER_VERSION = "2"
+
+
 def _convert_access(clang_access: ClangAccess) -> AccessSpecifier:
     """Convert clang access specifier to our enum."""
     mapping = {
@@ -99,16 +104,50 @@ class CppParser:
         self.index = Index.create()
         self._source_code: str = ""
 
+        # Live TUs kept for reparse: reusing a TU's preamble and symbol
+        # tables is far cheaper than a cold parse when the same file is
+        # re-analyzed within one process (e.g. watch mode). Bounded so
+        # resident memory stays O(window) rather than O(files).
+        self._tu_cache: dict[str, TranslationUnit] = {}
+        self._max_live_tus = 16
+
+        # On-disk cache of parse results so unchanged files skip libclang
+        self._cache_dir = config.cache_path / "parse_cache"
+        fingerprint_parts = [
+            PARSER_VERSION,
+            *config.parser.compile_flags,
+            *(str(p) for p in config.parser.include_paths),
+        ]
+        self._config_fingerprint = hashlib.blake2b(
+            "|".join(fingerprint_parts).encode(), digest_size=8
+        ).hexdigest()
+
     def parse_file(self, file_path: Path) -> CppFileAnalysis:
         """
         Parse a single C++ file and extract its structure.
 
+        Results are cached on disk keyed by (path, mtime, size) plus the
+        parser version and compile settings, so unchanged files skip the
+        expensive libclang translation unit entirely on re-runs.
+
         Args:
             file_path: Path to the C++ file to parse
 
         Returns:
             CppFileAnalysis containing all extracted information
         """
+        # Check the parse cache before touching libclang
+        try:
+            stat = file_path.stat()
+            cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size, self._config_fingerprint)
+        except OSError:
+            cache_key = None
+
+        if cache_key:
+            cached = self._load_cached_analysis(file_path, cache_key)
+            if cached is not None:
+                return cached
+
         # Read source code
         self._source_code = file_path.read_text(encoding="utf-8", errors="replace")
         file_hash = hashlib.sha256(self._source_code.encode()).hexdigest()[:16]
@@ -123,23 +162,43 @@ class CppParser:
         for include_path in self.config.parser.include_paths:
             compile_args.append(f"-I{include_path}")
 
-        # Parse with libclang
-        try:
-            tu = self.index.parse(
-                str(file_path),
-                args=compile_args,
-                options=(
-                    TranslationUnit.PARSE_DETAILED_PROCESSING_RECORD |
-                    TranslationUnit.PARSE_SKIP_FUNCTION_BODIES
-                ),
-            )
-        except Exception as e:
-            return CppFileAnalysis(
-                file_path=file_path,
-                file_hash=file_hash,
-                line_count=line_count,
-                parse_errors=[str(e)],
-            )
+        # Parse with libclang, reparsing a live TU when we have one
+        path_key = str(file_path)
+        tu = None
+
+        cached_tu = self._tu_cache.get(path_key)
+        if cached_tu is not None:
+            try:
+                cached_tu.reparse(unsaved_files=[(path_key, self._source_code)])
+                tu = cached_tu
+                # Refresh LRU position (dicts preserve insertion order)
+                self._tu_cache[path_key] = self._tu_cache.pop(path_key)
+            except Exception:
+                # Fall back to a cold parse below
+                del self._tu_cache[path_key]
+
+        if tu is None:
+            try:
+                tu = self.index.parse(
+                    path_key,
+                    args=compile_args,
+                    options=(
+                        TranslationUnit.PARSE_DETAILED_PROCESSING_RECORD |
+                        TranslationUnit.PARSE_SKIP_FUNCTION_BODIES
+                    ),
+                )
+                self._tu_cache[path_key] = tu
+                if len(self._tu_cache) > self._max_live_tus:
+                    # Evict the least recently used TU so bulk runs over
+                    # thousands of files release clang memory eagerly
+                    del self._tu_cache[next(iter(self._tu_cache))]
+            except Exception as e:
+                return CppFileAnalysis(
+                    file_path=file_path,
+                    file_hash=file_hash,
+                    line_count=line_count,
+                    parse_errors=[str(e)],
+                )
 
         # Collect parse diagnostics
         parse_errors = []
@@ -168,8 +227,42 @@ class CppParser:
         if not analysis.functions and not analysis.classes and parse_errors:
             self._fallback_regex_parse(analysis, self._source_code)
 
+        if cache_key:
+            self._store_cached_analysis(file_path, cache_key, analysis)
+
+        return analysis
+
+    def _analysis_cache_path(self, file_path: Path) -> Path:
+        """Get the cache file path for a source file."""
+        name = hashlib.blake2b(str(file_path).encode(), digest_size=16).hexdigest()
+        return self._cache_dir / f"{name}.pkl"
+
+    def _load_cached_analysis(
+        self, file_path: Path, cache_key: tuple
+    ) -> Optional[CppFileAnalysis]:
+        """Load a cached analysis if it matches the cache key."""
+        cache_path = self._analysis_cache_path(file_path)
+        try:
+            with open(cache_path, "rb") as f:
+                stored_key, analysis = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+            return None
+
+        if stored_key != cache_key:
+            return None
         return analysis
 
+    def _store_cached_analysis(
+        self, file_path: Path, cache_key: tuple, analysis: CppFileAnalysis
+    ) -> None:
+        """Persist a parse result for reuse on unchanged files."""
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._analysis_cache_path(file_path), "wb") as f:
+                pickle.dump((cache_key, analysis), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError):
+            pass  # Cache is best-effort; parsing already succeeded
+
     def _process_cursor(
         self,
         cursor: Cursor,
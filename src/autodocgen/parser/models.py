@@ -344,7 +344,7 @@ class NamespaceInfo:
     documentation: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CppFileAnalysis:
     """Complete analysis of a C++ source file."""
     file_path: Path
@@ -370,35 +370,54 @@ class CppFileAnalysis:
     # Documentation (file-level)
     file_documentation: str = ""  # LLM-generated overview
 
+    # Lazily built aggregate views. Whole-codebase passes (indexing,
+    # diagrams, headers) read these repeatedly, so the recursive walk is
+    # done once per file instead of once per access.
+    _all_classes_cache: Optional[list[ClassInfo]] = field(
+        default=None, repr=False, compare=False
+    )
+    _all_functions_cache: Optional[list[FunctionInfo]] = field(
+        default=None, repr=False, compare=False
+    )
+    _class_index_cache: Optional[dict[str, ClassInfo]] = field(
+        default=None, repr=False, compare=False
+    )
+
     @property
     def all_classes(self) -> list[ClassInfo]:
         """Get all classes including those in namespaces (recursive)."""
-        result = list(self.classes)
-        
-        def collect_from_ns(ns: NamespaceInfo):
-            result.extend(ns.classes)
-            for child_ns in ns.nested_namespaces:
-                collect_from_ns(child_ns)
-                
-        for ns in self.namespaces:
-            collect_from_ns(ns)
-            
-        return result
+        if self._all_classes_cache is None:
+            result = list(self.classes)
+
+            def collect_from_ns(ns: NamespaceInfo):
+                result.extend(ns.classes)
+                for child_ns in ns.nested_namespaces:
+                    collect_from_ns(child_ns)
+
+            for ns in self.namespaces:
+                collect_from_ns(ns)
+
+            self._all_classes_cache = result
+
+        return self._all_classes_cache
 
     @property
     def all_functions(self) -> list[FunctionInfo]:
         """Get all functions including those in namespaces (recursive)."""
-        result = list(self.functions)
-        
-        def collect_from_ns(ns: NamespaceInfo):
-            result.extend(ns.functions)
-            for child_ns in ns.nested_namespaces:
-                collect_from_ns(child_ns)
+        if self._all_functions_cache is None:
+            result = list(self.functions)
 
-        for ns in self.namespaces:
-            collect_from_ns(ns)
-            
-        return result
+            def collect_from_ns(ns: NamespaceInfo):
+                result.extend(ns.functions)
+                for child_ns in ns.nested_namespaces:
+                    collect_from_ns(child_ns)
+
+            for ns in self.namespaces:
+                collect_from_ns(ns)
+
+            self._all_functions_cache = result
+
+        return self._all_functions_cache
 
     @property
     def symbol_count(self) -> int:
@@ -414,10 +433,16 @@ class CppFileAnalysis:
 
     def get_class_by_name(self, name: str) -> Optional[ClassInfo]:
         """Find a class by name (checks all namespaces)."""
-        for cls in self.all_classes:
-            if cls.name == name or cls.qualified_name == name:
-                return cls
-        return None
+        # Lazily index both plain and qualified names; setdefault keeps
+        # the first class in scan order, matching the old linear search
+        if self._class_index_cache is None:
+            index: dict[str, ClassInfo] = {}
+            for cls in self.all_classes:
+                index.setdefault(cls.name, cls)
+                index.setdefault(cls.qualified_name, cls)
+            self._class_index_cache = index
+
+        return self._class_index_cache.get(name)
 
     def get_dependencies(self) -> list[str]:
         """Get list of files this file depends on (from includes)."""
@@ -5,7 +5,6 @@ File watcher for incremental documentation updates.
 from pathlib import Path
 from typing import Callable, Optional
 import time
-import fnmatch
 
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
@@ -36,7 +35,7 @@ class CppFileEventHandler(FileSystemEventHandler):
         self.config = config
         self.on_change = on_change
         self.extensions = set(config.parser.supported_extensions)
-        self.exclude_patterns = config.parser.exclude_patterns
+        self._is_excluded = config.parser.is_excluded
         self._debounce: dict[str, float] = {}
         self._debounce_seconds = 2.0  # Wait 2 seconds before processing
 
@@ -48,9 +47,8 @@ class CppFileEventHandler(FileSystemEventHandler):
         # Check exclude patterns
         try:
             relative = path.relative_to(self.config.codebase_path)
-            for pattern in self.exclude_patterns:
-                if fnmatch.fnmatch(str(relative), pattern):
-                    return False
+            if self._is_excluded(str(relative)):
+                return False
         except ValueError:
             return False
 
@@ -0,0 +1,40 @@
+"""Test that a Config stays picklable after the exclude regex is built.
+
+The parallel paths (analyzer parse pool, chunker pool, diagram pool)
+pickle the shared Config into worker processes, and the analyzer
+constructor always touches the exclude matcher first — so any
+unpicklable cached state breaks every multi-worker run.
+"""
+import pickle
+from pathlib import Path
+
+from autodocgen.config import Config
+
+
+def test_config_pickle():
+    config = Config(
+        codebase_path=Path("tests/graphics_buffer_lib"),
+        output_path=Path("docs_graphics_lib"),
+    )
+
+    # Prime the cached regex the way CodebaseAnalyzer.__init__ does
+    assert config.parser.is_excluded("vendor/third_party/foo/bar.cpp")
+    assert not config.parser.is_excluded("src/CameraBufferManager.cpp")
+
+    # Must survive the round trip into a ProcessPoolExecutor worker
+    restored = pickle.loads(pickle.dumps(config))
+
+    assert restored.parser.is_excluded("vendor/third_party/foo/bar.cpp")
+    assert not restored.parser.is_excluded("src/CameraBufferManager.cpp")
+
+    # Empty pattern list must also round-trip
+    config.parser.exclude_patterns = []
+    del config.parser.__dict__["exclude_regex"]  # drop the cached entry
+    assert not config.parser.is_excluded("vendor/third_party/foo/bar.cpp")
+    pickle.loads(pickle.dumps(config))
+
+    print("Config pickles cleanly after exclude matcher use")
+
+
+if __name__ == "__main__":
+    test_config_pickle()